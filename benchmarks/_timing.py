@@ -0,0 +1,13 @@
+"""Timing helper shared by the benchmark scripts."""
+import time
+
+def best_of(repeats, func, *args, **kwargs):
+    """(result of the last call, fastest wall time in seconds) over repeats calls of func(*args, **kwargs)."""
+    best = None
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
@@ -0,0 +1,47 @@
+"""
+Size Trends chart queries: the per-row size_class apply plus groupby passes over the filtered rows
+(the old tab code) against the same counts sliced from the aggregate cube.
+
+Usage: python benchmarks/bench_aggregates.py [path/to/satcat.html] [repeats]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _timing import best_of
+from constants import DATA_FILE
+from satcat_core.aggregates import build_trend_cube
+from satcat_core.classify import size_class
+from satcat_core.loading import load_catalog
+
+GROUPINGS = [['LaunchYear', 'SizeClass'], ['LaunchYear', 'Manufacturer'],
+             ['LaunchYear', 'OpOrbitOQU', 'SizeClass'], ['LaunchYear', 'MainOrbitClass', 'SizeClass']]
+
+def groupby_counts(df, years, coarse):
+    rows = df[df['LaunchYear'].between(*years).fillna(False).to_numpy() & df['CoarseType'].isin(coarse).to_numpy()]
+    rows = rows.assign(SizeClass=rows['Mass'].apply(size_class),
+                       MainOrbitClass=rows['OpOrbitOQU'].astype(str).str.split('/').str[0].where(rows['OpOrbitOQU'].notna()))
+    return [rows.groupby(by, observed=True).size() for by in GROUPINGS]
+
+def cube_counts(cube, years, coarse):
+    return [cube.query(by, years=years, filters={'CoarseType': coarse}).set_index(by)['Count'] for by in GROUPINGS]
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df, _ = load_catalog(html_file)
+    years, coarse = (int(df['LaunchYear'].min()), int(df['LaunchYear'].max())), ['P']
+    cube, t_build = best_of(1, build_trend_cube, df)
+    expected, t_groupby = best_of(repeats, groupby_counts, df, years, coarse)
+    got, t_cube = best_of(repeats, cube_counts, cube, years, coarse)
+    for by, ref, res in zip(GROUPINGS, expected, got):
+        if 'Manufacturer' not in by:
+            assert np.array_equal(ref.sort_index().to_numpy(), res.sort_index().to_numpy()), by
+    print(f"{html_file}: {len(df)} rows, {len(cube)} cube cells (best of {repeats})")
+    print(f"  cube build {t_build:8.3f} s (once per dataset)")
+    print(f"  groupby    {t_groupby:8.3f} s")
+    print(f"  cube query {t_cube:8.3f} s  ({t_groupby / t_cube:.1f}x faster)")
+    print("  counts identical")
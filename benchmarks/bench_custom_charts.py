@@ -0,0 +1,43 @@
+"""
+Custom Analysis figures: px charts over every filtered row against the server-side aggregation
+(bar/line per x), downsampled WebGL scatter and 2-D density binning from satcat_core.binning and charts.
+
+Usage: python benchmarks/bench_custom_charts.py [path/to/satcat.html] [max_points]
+"""
+import os
+import sys
+import time
+
+import plotly.express as px
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import density_figure
+from constants import DATA_FILE, SCATTER_MAX_POINTS
+from satcat_core.binning import aggregate_xy, downsample_rows
+from satcat_core.loading import load_catalog
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+def report(name, func):
+    payload, elapsed = timed(lambda: func().to_json())
+    print(f"  {name:34} {len(payload) / 1e3:10.1f} kB {elapsed:7.3f} s")
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    max_points = int(sys.argv[2]) if len(sys.argv) > 2 else SCATTER_MAX_POINTS
+    df, _ = load_catalog(html_file)
+    data = df[['LaunchYear', 'Mass', 'Perigee', 'Apogee', 'CoarseType']]
+    print(f"{html_file}: {len(df)} rows, figure JSON size and build time")
+    report("bar, every row", lambda: px.bar(data, x='LaunchYear', y='Mass', color='CoarseType'))
+    report("bar, sum per x and group", lambda: px.bar(aggregate_xy(data, 'LaunchYear', 'Mass', 'CoarseType', 'sum'),
+                                                      x='LaunchYear', y='Mass', color='CoarseType'))
+    report("line, every row", lambda: px.line(data, x='LaunchYear', y='Mass'))
+    report("line, mean per x", lambda: px.line(aggregate_xy(data, 'LaunchYear', 'Mass', None, 'mean'), x='LaunchYear', y='Mass'))
+    report("scatter, every row (svg)", lambda: px.scatter(data, x='Perigee', y='Apogee', render_mode='svg'))
+    report(f"scatter, {max_points} sampled (webgl)",
+           lambda: px.scatter(data.iloc[downsample_rows(len(data), max_points)], x='Perigee', y='Apogee', render_mode='webgl'))
+    report("scatter, 2-D density", lambda: density_figure(data['Perigee'], data['Apogee'], 'Perigee', 'Apogee'))
@@ -0,0 +1,29 @@
+"""
+DateConfidence classification: per-row Series.apply(get_date_confidence)
+against the vectorized satcat_core.classify.classify_date_confidence on the LDate column.
+
+Usage: python benchmarks/bench_date_confidence.py [path/to/satcat.html] [repeats]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _timing import best_of
+from constants import DATA_FILE
+from satcat_core.classify import classify_date_confidence, get_date_confidence
+from satcat_core.parsing import parse_satcat_html
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    ldates = parse_satcat_html(html_file)['LDate']
+    applied, t_apply = best_of(repeats, lambda s: s.apply(get_date_confidence), ldates)
+    vectorized, t_vectorized = best_of(repeats, classify_date_confidence, ldates)
+    assert np.array_equal(applied.to_numpy(dtype=object), vectorized.to_numpy(dtype=object))
+    print(f"{html_file}: {len(ldates)} LDate values, dtype {ldates.dtype} (best of {repeats})")
+    print(f"  apply      {t_apply:8.3f} s")
+    print(f"  vectorized {t_vectorized:8.3f} s  ({t_apply / t_vectorized:.1f}x faster)")
+    print("  classifications identical")
@@ -0,0 +1,66 @@
+"""
+Export time and peak memory: satcat_core.export.write_export (chunked) against copying the selection first
+(df.iloc[rows] then to_csv / to_parquet / to_feather), each in a fresh interpreter, for every row in Mass
+order (as a sorted table view exports them). Peak RSS is the Linux VmHWM high-water mark, reset after
+loading so it measures the export alone.
+
+Usage: python benchmarks/bench_export.py [path/to/satcat.html] [out_dir]
+"""
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from constants import DATA_FILE
+
+PROBE = """
+import json, sys, time
+import pyarrow
+sys.path.insert(0, {root!r})
+from satcat_core.export import write_export
+from satcat_core.loading import load_catalog
+df, _ = load_catalog({html_file!r})
+fmt, method, path = {fmt!r}, {method!r}, {path!r}
+rows = df['Mass'].argsort(kind='stable').to_numpy()
+def rss_kb(field):
+    with open('/proc/self/status') as f:
+        return next(int(line.split()[1]) for line in f if line.startswith(field))
+pyarrow.default_memory_pool().release_unused()
+with open('/proc/self/clear_refs', 'w') as f:
+    f.write('5')
+before = rss_kb('VmRSS')
+start = time.perf_counter()
+if method == 'chunked':
+    write_export(df, path, fmt, rows=rows)
+else:
+    copy = df.iloc[rows]
+    {{'csv': lambda: copy.to_csv(path, index=False), 'parquet': lambda: copy.to_parquet(path, index=False),
+      'arrow': lambda: copy.reset_index(drop=True).to_feather(path)}}[fmt]()
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'rss_mb': (rss_kb('VmHWM') - before) / 1024,
+                  'rows': len(df)}}))
+"""
+
+def run(html_file, fmt, method, path):
+    code = PROBE.format(root=ROOT, html_file=html_file, fmt=fmt, method=method, path=path)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        raise SystemExit(f"{method} {fmt} export failed (exit {result.returncode})")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    out_dir = sys.argv[2] if len(sys.argv) > 2 else '.'
+    os.makedirs(out_dir, exist_ok=True)
+    for fmt, extension in (('csv', '.csv'), ('parquet', '.parquet'), ('arrow', '.arrow')):
+        path = os.path.join(out_dir, f'bench_export{extension}')
+        for method in ('copy', 'chunked'):
+            stats = run(html_file, fmt, method, path)
+            size_mb = os.path.getsize(path) / 1e6
+            print(f"{fmt:8} {method:8} {stats['rows']:9} rows  {stats['seconds']:7.2f} s  "
+                  f"peak RSS +{stats['rss_mb']:7.1f} MB  file {size_mb:7.1f} MB")
+        os.remove(path)
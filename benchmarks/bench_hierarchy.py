@@ -0,0 +1,46 @@
+"""
+Hierarchy queries: repeated Parent.isin boolean scans (one full-frame pass per tree level) against
+satcat_core.hierarchy.HierarchyIndex, for the subtrees of the largest debris clouds, plus the
+per-root fragment summary.
+
+Usage: python benchmarks/bench_hierarchy.py [path/to/satcat.html] [repeats]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _timing import best_of
+from constants import DATA_FILE
+from satcat_core.hierarchy import HierarchyIndex
+from satcat_core.loading import load_catalog
+
+ROOTS = 5
+
+def scan_subtree(df, jcat):
+    parents = df['Parent'].astype(str).str.strip()
+    ids = df['#JCAT'].astype(str).str.strip().to_numpy()
+    found = np.zeros(len(df), dtype=bool)
+    frontier = {jcat}
+    while frontier:
+        level = parents.isin(frontier).to_numpy() & ~found
+        found |= level
+        frontier = set(ids[level]) - {jcat}
+    found[ids == jcat] = False
+    return np.flatnonzero(found)
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df, _ = load_catalog(html_file)
+    index, t_build = best_of(1, HierarchyIndex, df)
+    clouds, t_clouds = best_of(repeats, index.fragment_counts, df)
+    print(f"{html_file}: {len(df)} rows, index built in {t_build:.3f} s, "
+          f"{len(clouds)} cloud summaries in {t_clouds * 1e3:.1f} ms (best of {repeats})")
+    for row, jcat in zip(clouds.index[:ROOTS], clouds['JCAT'][:ROOTS]):
+        scanned, t_scan = best_of(repeats, scan_subtree, df, jcat)
+        found, t_index = best_of(repeats, index.subtree, row)
+        assert np.array_equal(scanned, found), jcat
+        print(f"  {jcat:10} {len(found):7} descendants   scan {t_scan * 1e3:8.2f} ms   index {t_index * 1e3:7.3f} ms")
@@ -0,0 +1,46 @@
+"""
+Figure payloads: px.histogram over the raw rows (binned in the browser) against satcat_core.binning,
+which bin on the server and send only bars, for the Mass histogram and a SatType byte chart.
+
+Usage: python benchmarks/bench_histograms.py [path/to/satcat.html]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import plotly.express as px
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from charts import category_figure, histogram_figure
+from constants import DATA_FILE
+from satcat_core.binning import category_counts, freedman_diaconis_bins, numeric_histogram
+from satcat_core.loading import load_catalog
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def report(name, raw, binned):
+    (raw_json, t_raw), (binned_json, t_binned) = raw, binned
+    print(f"  {name:10} raw rows {len(raw_json) / 1e6:8.2f} MB {t_raw:7.3f} s   "
+          f"server-binned {len(binned_json) / 1e3:7.1f} kB {t_binned:7.3f} s")
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    df, _ = load_catalog(html_file)
+    print(f"{html_file}: {len(df)} rows, figure JSON size and build time")
+    bins = freedman_diaconis_bins(df['Mass'].dropna().to_numpy())
+    edges, counts = numeric_histogram(df['Mass'])
+    assert counts.sum() == df['Mass'].notna().sum() and len(counts) == bins
+    report('Mass',
+           timed(lambda: px.histogram(df, x='Mass', nbins=bins).to_json()),
+           timed(lambda: histogram_figure(*numeric_histogram(df['Mass']), 'Mass', 'Mass (kg)').to_json()))
+    by_value = category_counts(df['SatType_1'])
+    assert np.array_equal(by_value.set_index('SatType_1')['Count'].sort_index().to_numpy(),
+                          df['SatType_1'].value_counts().loc[lambda c: c > 0].sort_index().to_numpy())
+    report('SatType_1',
+           timed(lambda: px.histogram(df, x='SatType_1', color='SatType_1').to_json()),
+           timed(lambda: category_figure(category_counts(df['SatType_1']), 'SatType_1').to_json()))
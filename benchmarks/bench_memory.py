@@ -0,0 +1,31 @@
+"""
+Memory report for the compact catalog schema.
+
+Parses the file once without and once with parsing.apply_compact_schema
+and prints per-column dtypes and deep memory usage of both frames.
+
+Usage: python benchmarks/bench_memory.py [path/to/satcat.html]
+"""
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import DATA_FILE
+from satcat_core import parsing
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    apply_compact_schema = parsing.apply_compact_schema
+    parsing.apply_compact_schema = lambda df: df
+    try:
+        before = parsing.parse_satcat_html(html_file)
+    finally:
+        parsing.apply_compact_schema = apply_compact_schema
+    after = parsing.parse_satcat_html(html_file)
+    # Same values once cast back (float32 columns only to float32 precision).
+    pd.testing.assert_frame_equal(before, after.astype(before.dtypes.to_dict()), check_exact=False, rtol=1e-6)
+    with pd.option_context('display.max_rows', None, 'display.width', 200, 'display.float_format', '{:.2f}'.format):
+        print(parsing.memory_report(before, after).to_string(index=False))
@@ -0,0 +1,74 @@
+"""
+Parse-time comparison of the SATCAT fixed-width engines.
+
+Times the column-slicing stage on its own and the whole parse_satcat_html call,
+for the reference whole-file row loop ('python') and the streaming vectorized
+parser ('numpy') in one process and in a process pool, reports the peak RSS of each engine in a fresh process, and
+checks that both engines produce identical frames.
+
+Usage: python benchmarks/bench_parse.py [path/to/satcat.html] [repeats] [workers]
+"""
+import os
+import re
+import resource
+import subprocess
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _timing import best_of
+from constants import DATA_FILE
+from satcat_core.parsing import _DATA_LINE_RE, _slice_fixed_width_columns, _slice_fixed_width_rows, parse_satcat_html
+
+def read_data_section(html_file):
+    with open(html_file, 'r', encoding='utf-8') as f:
+        pre_matches = re.findall(r'<PRE>(.*?)</PRE>', f.read(), re.DOTALL)
+    header_text = pre_matches[0].strip()
+    data_text = next(m.strip() for m in pre_matches[1:] if m.strip())
+    header_positions = [m.start() for m in re.finditer(r'\S+', header_text)] + [len(header_text) + 1]
+    data_lines = [line for line in data_text.split('\n') if _DATA_LINE_RE.match(line)]
+    return data_lines, header_positions
+
+def peak_rss_mb(html_file, engine):
+    """Peak resident memory of a fresh interpreter that only parses html_file with engine."""
+    out = subprocess.run([sys.executable, __file__, '--peak-rss', engine, html_file],
+                         check=True, capture_output=True, text=True).stdout
+    return float(out.split()[-1])
+
+def _high_water_kib():
+    # VmHWM is per address space; ru_maxrss would carry over the parent's peak across exec on Linux.
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+if __name__ == "__main__" and sys.argv[1:2] == ['--peak-rss']:
+    baseline = _high_water_kib()
+    parse_satcat_html(sys.argv[3], engine=sys.argv[2])
+    print((_high_water_kib() - baseline) / 1024)
+elif __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    data_lines, header_positions = read_data_section(html_file)
+    n_columns = len(header_positions) - 1
+    _, t_slice_python = best_of(repeats, _slice_fixed_width_rows, data_lines, header_positions, n_columns)
+    _, t_slice_numpy = best_of(repeats, _slice_fixed_width_columns, data_lines, header_positions, n_columns)
+    df_python, t_python = best_of(repeats, parse_satcat_html, html_file, engine='python')
+    df_numpy, t_numpy = best_of(repeats, parse_satcat_html, html_file, engine='numpy')
+    df_parallel, t_parallel = best_of(repeats, parse_satcat_html, html_file, engine='numpy', workers=workers)
+    pd.testing.assert_frame_equal(df_python, df_numpy)
+    pd.testing.assert_frame_equal(df_numpy, df_parallel)
+    print(f"{html_file}: {len(df_numpy)} rows x {df_numpy.shape[1]} columns (best of {repeats})")
+    print(f"  slicing      python {t_slice_python:8.3f} s   numpy {t_slice_numpy:8.3f} s   ({t_slice_python / t_slice_numpy:.1f}x)")
+    print(f"  full parse   python {t_python:8.3f} s   numpy {t_numpy:8.3f} s   ({t_python / t_numpy:.1f}x)")
+    print(f"  parallel     {workers} workers {t_parallel:8.3f} s   ({t_numpy / t_parallel:.1f}x vs one process)")
+    print(f"  peak RSS     python {peak_rss_mb(html_file, 'python'):8.1f} MB  numpy {peak_rss_mb(html_file, 'numpy'):8.1f} MB")
+    print(f"  final frame  {df_numpy.memory_usage(deep=True).sum() / 2**20:.1f} MB")
+    print("  frames identical")
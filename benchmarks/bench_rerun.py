@@ -0,0 +1,56 @@
+"""
+Streamlit rerun latency with every tab rendered under st.tabs (eager) against lazy mode, where only
+the selected tab runs. Each mode runs in its own process under streamlit.testing's AppTest; the timed
+reruns move the Overview year slider, as a user would.
+
+Run it from a directory containing satcat.html, or pass the file (it is linked into a scratch directory).
+
+Usage: python benchmarks/bench_rerun.py [path/to/satcat.html] [reruns]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'satcat_app.py')
+
+def measure(reruns):
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP, default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+    slider = next(s for s in at.slider if s.label == "Launch Year Range")
+    low, high = slider.value
+    timings = []
+    for i in range(reruns):
+        slider.set_value((low + i % 2, high))
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    print(f"{first:.3f} {statistics.median(timings):.3f} {len(at.get('plotly_chart'))}")
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == '--child':
+        measure(int(sys.argv[2]))
+        sys.exit(0)
+    html_file = sys.argv[1] if len(sys.argv) > 1 else 'satcat.html'
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    workdir = os.getcwd()
+    if len(sys.argv) > 1:
+        workdir = tempfile.mkdtemp(prefix='satcat_rerun_')
+        os.symlink(os.path.abspath(html_file), os.path.join(workdir, 'satcat.html'))
+    print(f"{html_file}: median of {reruns} reruns after a year-slider change")
+    results = {}
+    for mode, lazy in [('eager', '0'), ('lazy', '1')]:
+        env = dict(os.environ, SATEXPLORER_LAZY_TABS=lazy)
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', str(reruns)], cwd=workdir, env=env,
+                             capture_output=True, text=True, check=True).stdout.split()
+        first, rerun, charts = float(out[-3]), float(out[-2]), int(out[-1])
+        results[mode] = rerun
+        print(f"  {mode:5}  first run {first:7.3f} s  rerun {rerun:7.3f} s  ({charts} charts built)")
+    print(f"  lazy reruns {results['eager'] / results['lazy']:.1f}x faster")
@@ -0,0 +1,38 @@
+"""
+Search latency: str.contains scans over the name and identifier columns (what a browser-side filter
+does per keystroke) against satcat_core.search.SearchIndex, for a few typed queries.
+
+Usage: python benchmarks/bench_search.py [path/to/satcat.html] [repeats]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _timing import best_of
+from constants import DATA_FILE
+from satcat_core.loading import load_catalog
+from satcat_core.search import KEY_COLUMNS, TEXT_COLUMNS, SearchIndex
+
+QUERIES = ['S0001', '2510', '1998-067', 'kos', 'starlink', 'nasa']
+
+def scan(df, query):
+    columns = [column for column in KEY_COLUMNS + TEXT_COLUMNS if column in df.columns]
+    hits = np.zeros(len(df), dtype=bool)
+    for column in columns:
+        hits |= df[column].astype(str).str.upper().str.contains(query.upper(), regex=False).to_numpy(dtype=bool)
+    return np.flatnonzero(hits)
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df, _ = load_catalog(html_file)
+    index, t_build = best_of(1, SearchIndex, df)
+    print(f"{html_file}: {len(df)} rows, index built in {t_build:.3f} s (best of {repeats})")
+    for query in QUERIES:
+        scanned, t_scan = best_of(repeats, scan, df, query)
+        found, t_index = best_of(repeats, index.search, query)
+        print(f"  {query!r:12} scan {t_scan * 1e3:8.2f} ms ({len(scanned):7} substring hits)   "
+              f"index {t_index * 1e3:7.3f} ms ({len(found):7} prefix/word hits)")
@@ -0,0 +1,38 @@
+"""
+Basic Statistics table: describe(include='all') over the year/type-filtered rows (the old Overview code)
+against satcat_core.stats.ColumnStats, which merges per LaunchYear x CoarseType partials.
+
+Usage: python benchmarks/bench_stats.py [path/to/satcat.html] [repeats]
+"""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _timing import best_of
+from constants import DATA_FILE
+from satcat_core.loading import load_catalog
+from satcat_core.stats import ColumnStats
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    df, _ = load_catalog(html_file)
+    types, years = ['P', 'R'], (1990, 2010)
+    selected = df[df['CoarseType'].isin(types) & df['LaunchYear'].between(*years).fillna(False)]
+    described, t_describe = best_of(repeats, lambda: selected.describe(include='all').transpose())
+    _, t_describe_all = best_of(repeats, lambda: df.describe(include='all').transpose())
+    stats, t_build = best_of(1, ColumnStats, df)
+    summary, t_query = best_of(repeats, stats.summary, years, {'CoarseType': types})
+    _, t_query_all = best_of(repeats, stats.summary)
+    numeric = summary['numeric']
+    assert np.array_equal(numeric['count'].to_numpy(), described.loc[numeric.index, 'count'].to_numpy(dtype='int64'))
+    assert np.allclose(numeric['mean'], described.loc[numeric.index, 'mean'].astype(float), rtol=1e-5)
+    error = (numeric['50%'] - described.loc[numeric.index, '50%'].astype(float)).abs() / (numeric['max'] - numeric['min'])
+    print(f"{html_file}: {len(df)} rows, {len(selected)} selected, {len(stats)} partitions (best of {repeats})")
+    print(f"  describe, filtered   {t_describe * 1e3:9.1f} ms   whole catalog {t_describe_all * 1e3:9.1f} ms")
+    print(f"  partials, filtered   {t_query * 1e3:9.1f} ms   whole catalog {t_query_all * 1e3:9.1f} ms")
+    print(f"  partials build       {t_build:9.3f} s (once per dataset)")
+    print(f"  counts and means identical, median error at most {error.max():.2%} of the column range")
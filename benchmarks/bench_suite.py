@@ -0,0 +1,148 @@
+"""
+Benchmark suite over synthetic catalogs of several sizes (generate_satcat.py, cached in --data-dir).
+
+Each size runs in a fresh interpreter and measures the parse stages (fixed-width slicing, derived
+columns, compact schema), the date-confidence and size-class classifiers, peak memory, filter latency
+(boolean indexing vs FilterEngine cold and cached) and aggregate latency (groupby vs trend cube).
+Results go to a JSON file with the environment, so two runs can be compared with --compare.
+
+Usage: python benchmarks/bench_suite.py [--sizes 50000,200000,1000000,10000000] [--out results.json]
+       python benchmarks/bench_suite.py --compare baseline.json results.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from _timing import best_of
+from generate_satcat import generate_satcat
+
+DEFAULT_SIZES = [50000, 200000, 1000000]
+DATA_DIR = os.path.join(ROOT, '.satcat_cache', 'synthetic')
+
+def _high_water_mb():
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def measure(html_file, repeats):
+    """Metrics of one catalog file, measured in this process (run it in a fresh one)."""
+    import numpy as np
+
+    from satcat_core.classify import classify_date_confidence, classify_size_class
+    from satcat_core.dataset import SatcatDataset
+    from satcat_core.filters import between, isin, make_spec
+    from satcat_core.parsing import apply_compact_schema, derive_satcat_columns, slice_satcat_html
+
+    baseline_mb = _high_water_mb()
+    metrics = {}
+    df, metrics['slice_s'] = best_of(1, slice_satcat_html, html_file)
+    _, metrics['derive_s'] = best_of(1, derive_satcat_columns, df)
+    df, metrics['compact_s'] = best_of(1, apply_compact_schema, df)
+    metrics['parse_s'] = metrics['slice_s'] + metrics['derive_s'] + metrics['compact_s']
+    metrics['parse_peak_rss_mb'] = _high_water_mb() - baseline_mb
+    metrics['frame_mb'] = df.memory_usage(deep=True).sum() / 2**20
+    metrics['rows'] = len(df)
+    _, metrics['date_confidence_s'] = best_of(repeats, classify_date_confidence, df['LDate'])
+    _, metrics['size_class_s'] = best_of(repeats, classify_size_class, df['Mass'])
+
+    def boolean_indexing():
+        return df[df['CoarseType'].isin(['P', 'R']) & df['LaunchYear'].between(1990, 2010).fillna(False)]
+
+    dataset = SatcatDataset(df, None, html_file, 0)
+    spec = make_spec({'CoarseType': isin(['P', 'R']), 'LaunchYear': between(1990, 2010)})
+    expected, t_indexing = best_of(repeats, boolean_indexing)
+    mask, t_cold = best_of(1, dataset.filters.mask, spec)
+    _, t_cached = best_of(repeats, dataset.filters.mask, spec)
+    assert int(mask.sum()) == len(expected)
+    metrics.update(filter_boolean_ms=t_indexing * 1e3, filter_engine_cold_ms=t_cold * 1e3,
+                   filter_engine_cached_ms=t_cached * 1e3)
+
+    cube, metrics['cube_build_s'] = best_of(1, lambda: dataset.trend_cube)
+    by_cube, t_cube = best_of(repeats, cube.query, ['LaunchYear', 'CoarseType'], (1990, 2010))
+    grouped = df[df['LaunchYear'].between(1990, 2010).fillna(False)]
+    by_groupby, t_groupby = best_of(repeats, lambda: grouped.groupby(['LaunchYear', 'CoarseType'], observed=True).size())
+    assert np.array_equal(np.sort(by_cube['Count'].to_numpy()), np.sort(by_groupby.to_numpy()))
+    metrics.update(aggregate_groupby_ms=t_groupby * 1e3, aggregate_cube_ms=t_cube * 1e3)
+    metrics['peak_rss_mb'] = _high_water_mb() - baseline_mb
+    return metrics
+
+def run_size(rows, data_dir, repeats, seed):
+    path = os.path.join(data_dir, f'satcat_{rows}_{seed}.html')
+    if not os.path.exists(path):
+        os.makedirs(data_dir, exist_ok=True)
+        start = time.perf_counter()
+        generate_satcat(path + '.tmp', rows, seed)
+        os.replace(path + '.tmp', path)
+        print(f"  generated {path} in {time.perf_counter() - start:.1f} s", file=sys.stderr)
+    out = subprocess.run([sys.executable, __file__, '--measure', path, '--repeats', str(repeats)],
+                         check=True, capture_output=True, text=True).stdout
+    metrics = json.loads(out.splitlines()[-1])
+    metrics['file_mb'] = os.path.getsize(path) / 2**20
+    return metrics
+
+def environment():
+    import numpy as np
+    import pandas as pd
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': commit, 'python': platform.python_version(),
+            'numpy': np.__version__, 'pandas': pd.__version__, 'platform': platform.platform(), 'cpus': os.cpu_count()}
+
+def compare(baseline_file, results_file):
+    """Prints each metric of results_file next to baseline_file, per size, as a ratio (<1 is faster / smaller)."""
+    with open(baseline_file) as f:
+        baseline = {run['rows']: run for run in json.load(f)['runs']}
+    with open(results_file) as f:
+        results = json.load(f)['runs']
+    for run in results:
+        old = baseline.get(run['rows'])
+        if old is None:
+            continue
+        print(f"{run['rows']} rows")
+        for key, value in run.items():
+            if key != 'rows' and isinstance(value, (int, float)) and old.get(key):
+                print(f"  {key:26} {old[key]:12.3f} -> {value:12.3f}  ({value / old[key]:.2f}x)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)), help='comma-separated row counts')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--data-dir', default=DATA_DIR, help='where generated catalogs are kept between runs')
+    parser.add_argument('--out', default=os.path.join(ROOT, 'benchmarks', 'results', f'suite_{time.strftime("%Y%m%d_%H%M%S")}.json'))
+    parser.add_argument('--measure', help=argparse.SUPPRESS)
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'RESULTS'))
+    args = parser.parse_args()
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.repeats)))
+    elif args.compare:
+        compare(*args.compare)
+    else:
+        runs = []
+        for rows in (int(size) for size in args.sizes.split(',')):
+            metrics = run_size(rows, args.data_dir, args.repeats, args.seed)
+            runs.append(metrics)
+            print(f"{rows:>9} rows  parse {metrics['parse_s']:7.2f} s  peak {metrics['peak_rss_mb']:8.1f} MB  "
+                  f"derive {metrics['derive_s']:6.2f} s  filter {metrics['filter_engine_cached_ms']:7.3f} ms cached "
+                  f"/ {metrics['filter_boolean_ms']:8.2f} ms indexing  cube {metrics['aggregate_cube_ms']:6.2f} ms "
+                  f"/ groupby {metrics['aggregate_groupby_ms']:7.2f} ms")
+        os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+        with open(args.out, 'w') as f:
+            json.dump({'environment': environment(), 'runs': runs}, f, indent=1)
+        print(f"wrote {args.out}")
@@ -0,0 +1,44 @@
+"""
+Raw Data Table payload: the whole catalog frame serialized for st.dataframe against one page from
+paged_table (cached sort order, page slice, column projection), at growing catalog sizes.
+
+Usage: python benchmarks/bench_table.py [path/to/satcat.html] [page_size]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.dataframe_util import convert_pandas_df_to_arrow_bytes
+
+from constants import DATA_FILE
+from paged_table import page_rows
+from satcat_core.dataset import SatcatDataset
+from satcat_core.loading import load_catalog
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+def full_payload(df):
+    return convert_pandas_df_to_arrow_bytes(df)
+
+def page_payload(dataset, page_size):
+    positions = page_rows(dataset, None, 'Mass', True)
+    return convert_pandas_df_to_arrow_bytes(dataset.df.iloc[positions[page_size:2 * page_size]])
+
+if __name__ == "__main__":
+    html_file = sys.argv[1] if len(sys.argv) > 1 else DATA_FILE
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    df, _ = load_catalog(html_file)
+    print(f"{html_file}: page 2 of {page_size} rows sorted by Mass, against the full frame")
+    for fraction in [0.125, 0.25, 0.5, 1.0]:
+        sample = df.iloc[:max(1, int(len(df) * fraction))]
+        dataset = SatcatDataset(sample, None, html_file, 0)
+        dataset.sort_order('Mass', True)
+        full, t_full = timed(full_payload, sample)
+        page, t_page = timed(page_payload, dataset, page_size)
+        print(f"  {len(sample):>9} rows  full {len(full) / 1e6:8.2f} MB {t_full:7.3f} s   "
+              f"page {len(page) / 1e3:7.1f} kB {t_page:7.4f} s")
@@ -0,0 +1,43 @@
+"""
+Cold-start import budget for the CLI path: imports satcat_cli in a fresh interpreter, fails if that pulls in
+streamlit or plotly or takes longer than IMPORT_BUDGET_SECONDS, and prints the slowest modules from -X importtime.
+
+Usage: python benchmarks/check_import_time.py [budget_seconds]
+"""
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPORT_BUDGET_SECONDS = 1.5
+FORBIDDEN = ('streamlit', 'plotly')
+
+PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import satcat_cli\n"
+    "elapsed = time.perf_counter() - start\n"
+    f"loaded = [name for name in {FORBIDDEN!r} if name in sys.modules]\n"
+    "print(elapsed, ','.join(loaded))\n"
+)
+
+def slowest_imports(stderr, count=10):
+    rows = []
+    for line in stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].rstrip()))
+    return sorted(rows, reverse=True)[:count]
+
+if __name__ == "__main__":
+    budget = float(sys.argv[1]) if len(sys.argv) > 1 else IMPORT_BUDGET_SECONDS
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', PROBE], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+    elapsed, *loaded = proc.stdout.split()
+    elapsed = float(elapsed)
+    print(f"import satcat_cli: {elapsed:.3f} s (budget {budget:.2f} s)")
+    for cumulative_us, name in slowest_imports(proc.stderr):
+        print(f"  {cumulative_us / 1e3:9.1f} ms {name}")
+    assert not loaded, f"CLI path imports {loaded[0]}"
+    assert elapsed <= budget, f"CLI import took {elapsed:.3f} s, over the {budget:.2f} s budget"
+    print("ok")
@@ -0,0 +1,102 @@
+"""
+Catalog refresh against a local stand-in server: serves synthetic catalogs (generate_satcat.py) from an
+http.server on localhost with an ETag per body and 304s for a matching If-None-Match, and checks each outcome of
+satcat_core.fetch.refresh_satcat_file, including that an error page served with status 200 is rejected
+and neither the catalog nor the stored validators change.
+
+Usage: python benchmarks/check_refresh.py [rows]
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from generate_satcat import generate_satcat
+from satcat_core.fetch import (REFRESH_NOT_MODIFIED, REFRESH_UNCHANGED, REFRESH_UPDATED, _http_meta_path,
+                               refresh_satcat_file)
+
+ERROR_PAGE = b'<HTML><BODY><H1>503 Service Unavailable</H1><PRE>upstream timed out</PRE></BODY></HTML>\n'
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    """Serves server.body with a strong ETag; server.status overrides the status code."""
+
+    def do_GET(self):
+        body = self.server.body
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        self.server.requests.append(self.headers.get('If-None-Match'))
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self.send_response(self.server.status)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def catalog_bytes(work_dir, rows, seed):
+    path = os.path.join(work_dir, f'source_{seed}.html')
+    generate_satcat(path, rows, seed)
+    with open(path, 'rb') as f:
+        return f.read()
+
+def read(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+def check(label, result, status):
+    assert result.status == status, f"{label}: expected {status}, got {result.status}"
+    print(f"  {label:44} {result.status:13} {result.bytes_downloaded:9} bytes  updated {result.update_date}")
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as work_dir:
+        first, second = catalog_bytes(work_dir, rows, 1), catalog_bytes(work_dir, rows, 2)
+        data_file = os.path.join(work_dir, 'satcat.html')
+        cache_dir = os.path.join(work_dir, 'cache')
+        server = ThreadingHTTPServer(('127.0.0.1', 0), CatalogHandler)
+        server.body, server.status, server.requests = first, 200, []
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{server.server_address[1]}/satcat.html'
+        try:
+            check("first download", refresh_satcat_file(data_file, url, cache_dir), REFRESH_UPDATED)
+            assert read(data_file) == first
+            check("repeat with validators", refresh_satcat_file(data_file, url, cache_dir), REFRESH_NOT_MODIFIED)
+            assert server.requests[-1] is not None
+            server.body = second
+            check("changed catalog", refresh_satcat_file(data_file, url, cache_dir), REFRESH_UPDATED)
+            assert read(data_file) == second
+            os.remove(_http_meta_path(data_file, cache_dir))
+            check("same catalog, no stored validators", refresh_satcat_file(data_file, url, cache_dir), REFRESH_UNCHANGED)
+            assert server.requests[-1] is None
+            meta = read(_http_meta_path(data_file, cache_dir))
+            server.body = ERROR_PAGE
+            try:
+                refresh_satcat_file(data_file, url, cache_dir)
+            except ValueError as e:
+                print(f"  {'error page with status 200':44} rejected: {e}")
+            else:
+                raise AssertionError("an error page replaced the catalog")
+            assert read(data_file) == second and read(_http_meta_path(data_file, cache_dir)) == meta
+            server.status = 503
+            try:
+                refresh_satcat_file(data_file, url, cache_dir)
+            except Exception as e:
+                print(f"  {'status 503':44} rejected: {type(e).__name__}")
+            else:
+                raise AssertionError("a 503 response was accepted")
+            assert read(data_file) == second
+            assert not [name for name in os.listdir(work_dir) if name.endswith('.download')]
+        finally:
+            server.shutdown()
+            server.server_close()
+    print("ok")
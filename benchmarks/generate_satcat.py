@@ -0,0 +1,122 @@
+"""
+Synthetic catalogs in the satcat.html layout for benchmarking: a header <PRE> block, then `S`-prefixed
+fixed-width rows with GCAT-like Type codes, vague LDate/SDate/DDate/ODate strings, parent links,
+log-normal masses and orbits. Rows are generated and written in batches, so 10M-row files need little memory.
+The same seed and size always give the same file.
+
+Usage: python benchmarks/generate_satcat.py out.html rows [seed]
+"""
+import sys
+
+import numpy as np
+
+# Header name and field width (value plus padding) of each column, as in the GCAT satcat file.
+COLUMNS = [
+    ("#JCAT", 9), ("Satcat", 9), ("Piece", 13), ("Type", 13), ("Name", 33), ("PLName", 25),
+    ("LDate", 22), ("Parent", 13), ("SDate", 22), ("Primary", 13), ("DDate", 22), ("Status", 7),
+    ("Dest", 9), ("Owner", 13), ("State", 6), ("Manufacturer", 13), ("Bus", 17), ("Motor", 17),
+    ("Mass", 9), ("MassFlag", 9), ("DryMass", 8), ("DryFlag", 8), ("TotMass", 8), ("TotFlag", 8),
+    ("Length", 7), ("LFlag", 6), ("Diameter", 9), ("DFlag", 6), ("Span", 7), ("SpanFlag", 9),
+    ("Shape", 19), ("ODate", 22), ("Perigee", 8), ("PF", 3), ("Apogee", 8), ("AF", 3), ("Inc", 7),
+    ("IF", 3), ("OpOrbitOQU", 11), ("AltNames", 20),
+]
+ROW_FORMAT = ''.join(f'{{:<{width}}}' for _, width in COLUMNS)
+BATCH_ROWS = 50000
+MONTHS = np.array("Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split())
+
+# (Type code, weight): mostly debris and payloads, then rocket stages, components and suborbital objects.
+TYPE_CODES = [
+    ("D", 30), ("D  A", 6), ("D  F", 4), ("DX", 2), ("P", 14), ("PA", 4), ("P  S", 3), ("P  AF", 2),
+    ("PH", 1), ("PX", 1), ("R1", 4), ("R2", 5), ("R3", 2), ("R4", 1), ("R2  A", 1), ("C", 3), ("C  A", 1),
+    ("S", 2), ("S1", 1), ("X", 1), ("Z", 1), ("PA -AC", 1), ("D  AU-", 1),
+]
+STATUS = ["O", "R", "D", "L", "AO", "E", "N"]
+OWNERS = ["NASA", "USAF", "SPXS", "MOD", "CNSA", "ESA", "JAXA", "ISRO", "ROSC", "OWEB", "PLAN"]
+STATES = ["US", "SU", "RU", "CN", "F", "J", "IN", "UK", "I-ESA", "D"]
+MANUFACTURERS = ["BOE", "LM", "SPX", "NPOL", "ISRO", "TAS", "AIRB", "CAST", "SSL", "NGIS", "OHB", "MIT", "-"]
+SHAPES = ["Cyl", "Box", "Sphere", "Box + 2 pan", "Cone", "Irr", "-"]
+ORBITS = ["LEO/I", "LEO/S", "LEO/P", "LEO/R", "MEO", "GEO/S", "GEO/D", "GTO", "HEO", "VHEO", "DSO", "SO", "-"]
+ORBIT_WEIGHTS = [40, 12, 6, 6, 4, 6, 2, 5, 4, 1, 2, 4, 8]
+NAMES = ["Starlink", "Kosmos", "OneWeb", "Iridium", "Molniya", "Intelsat", "Fengyun", "Yaogan", "Debris",
+         "Delta 2 R/B", "SL-8 R/B", "CZ-4B R/B", "Tiangong", "GPS", "Landsat", "Meteor"]
+
+def _weighted(rng, options, weights, size):
+    weights = np.asarray(weights, dtype=float)
+    return np.asarray(options, dtype=object)[rng.choice(len(options), size=size, p=weights / weights.sum())]
+
+def vague_dates(rng, years):
+    """GCAT-style vague dates around years: '-', year, month, day, day+time, seconds, with '?' on some."""
+    n = len(years)
+    months = MONTHS[rng.integers(0, 12, n)]
+    days = rng.integers(1, 29, n)
+    hours, minutes, seconds = rng.integers(0, 24, n), rng.integers(0, 60, n), rng.integers(0, 60, n)
+    precision = rng.choice(6, size=n, p=[0.03, 0.04, 0.05, 0.28, 0.3, 0.3])
+    uncertain = rng.random(n) < 0.04
+    out = []
+    for year, month, day, hour, minute, second, prec, q in zip(years, months, days, hours, minutes, seconds,
+                                                               precision, uncertain):
+        if prec == 0:
+            out.append('-')
+            continue
+        text = (f'{year}', f'{year} {month}', f'{year} {month} {day:2d}', f'{year} {month} {day:2d} {hour:02d}{minute:02d}',
+                f'{year} {month} {day:2d} {hour:02d}{minute:02d}:{second:02d}')[min(prec, 5) - 1]
+        out.append(text + '?' if q else text)
+    return out
+
+def _format_number(values, fmt, missing):
+    return [fmt.format(v) if present else '-' for v, present in zip(values, ~missing)]
+
+def generate_rows(rng, start, n):
+    """Formatted data lines for JCAT numbers start+1 .. start+n."""
+    jcat = np.arange(start + 1, start + n + 1)
+    # Launch rate grows over time, as in the real catalog.
+    years = (1957 + 68 * np.sqrt(rng.random(n))).astype(int)
+    types = _weighted(rng, [code for code, _ in TYPE_CODES], [w for _, w in TYPE_CODES], n)
+    # Debris, stages and components point back at an earlier object.
+    has_parent = np.isin([code[0] for code in types], ['D', 'R', 'C']) & (jcat > 1)
+    parents = (rng.random(n) * np.maximum(jcat - 1, 1)).astype(int) + 1
+    mass = np.round(np.exp(rng.normal(5.0, 2.0, n)), 1)
+    perigee = np.round(np.exp(rng.normal(6.3, 1.0, n)))
+    apogee = perigee + np.round(np.exp(rng.normal(4.0, 2.5, n)))
+    inclination = np.round(rng.uniform(0, 110, n), 2)
+    launch = vague_dates(rng, years)
+    separation = vague_dates(rng, years)
+    decay = vague_dates(rng, np.minimum(years + rng.integers(0, 30, n), 2025))
+    orbit_dates = vague_dates(rng, years)
+    piece = [f'{year}-{number:03d}{letter}' for year, number, letter in
+             zip(years, rng.integers(1, 200, n), np.array(list('ABCDEFGH'))[rng.integers(0, 8, n)])]
+    names = [f'{name} {number}' for name, number in zip(_weighted(rng, NAMES, np.ones(len(NAMES)), n), rng.integers(1, 5000, n))]
+    mass_text = _format_number(mass, '{:.1f}', rng.random(n) < 0.35)
+    orbit_missing = rng.random(n) < 0.05
+    perigee_text = _format_number(perigee, '{:.0f}', orbit_missing)
+    apogee_text = _format_number(apogee, '{:.0f}', orbit_missing)
+    inc_text = _format_number(inclination, '{:.2f}', orbit_missing)
+    status = _weighted(rng, STATUS, [30, 35, 20, 5, 4, 3, 3], n)
+    owners = _weighted(rng, OWNERS, np.ones(len(OWNERS)), n)
+    states = _weighted(rng, STATES, [30, 25, 5, 15, 3, 3, 3, 3, 2, 2], n)
+    manufacturers = _weighted(rng, MANUFACTURERS, np.ones(len(MANUFACTURERS)), n)
+    shapes = _weighted(rng, SHAPES, np.ones(len(SHAPES)), n)
+    orbits = _weighted(rng, ORBITS, ORBIT_WEIGHTS, n)
+    lines = []
+    for i in range(n):
+        values = (f'S{jcat[i]:05d}', str(jcat[i]), piece[i], types[i], names[i], '-', launch[i],
+                  f'S{parents[i]:05d}' if has_parent[i] else '-', separation[i], 'Earth', decay[i], status[i],
+                  '-', owners[i], states[i], manufacturers[i], '-', '-', mass_text[i], '', '-', '', '-', '',
+                  '-', '', '-', '', '-', '', shapes[i], orbit_dates[i], perigee_text[i], '', apogee_text[i], '',
+                  inc_text[i], '', orbits[i], '-')
+        lines.append(ROW_FORMAT.format(*values).rstrip())
+    return lines
+
+def generate_satcat(path, rows, seed=1, batch_rows=BATCH_ROWS):
+    """Writes a rows-row synthetic catalog to path."""
+    rng = np.random.default_rng(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<HTML>\n<PRE>\n' + ''.join(name.ljust(width) for name, width in COLUMNS).rstrip() + '\n</PRE>\n<PRE>\n')
+        f.write('# Updated 2025 Jan  5 12:00\n')
+        for start in range(0, rows, batch_rows):
+            f.write('\n'.join(generate_rows(rng, start, min(batch_rows, rows - start))) + '\n')
+        f.write('</PRE>\n</HTML>\n')
+    return path
+
+if __name__ == "__main__":
+    generate_satcat(sys.argv[1], int(sys.argv[2]), int(sys.argv[3]) if len(sys.argv) > 3 else 1)
@@ -0,0 +1,51 @@
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from satcat_core.binning import density_bins
+from satcat_core.perf import instrumented, timed
+
+# Plotly figures for the counts and bins computed in satcat_core.binning.
+
+@instrumented('chart:histogram_figure')
+def histogram_figure(edges, counts, title, x_label, y_label='Count'):
+    """Bar trace of precomputed histogram bins: the figure holds one bar per bin, not the rows."""
+    fig = go.Figure(go.Bar(x=edges[:-1], y=counts, width=np.diff(edges), offset=0,
+                           hovertemplate=f'{x_label}: %{{x}}<br>{y_label}: %{{y}}<extra></extra>'))
+    fig.update_layout(title=title, xaxis_title=x_label, yaxis_title=y_label, bargap=0)
+    return fig
+
+@instrumented('chart:category_figure')
+def category_figure(counts, title, x_label=None):
+    """Bar chart of a category_counts frame, one colour per value as px.histogram(color=...) drew it."""
+    column = counts.columns[0]
+    return px.bar(counts, x=column, y='Count', color=column, title=title,
+                  labels={column: x_label or column})
+
+@instrumented('chart:density_figure')
+def density_figure(x_values, y_values, x_label, y_label):
+    """Heatmap of the 2-D histogram of numeric x/y (see density_bins)."""
+    counts, x_edges, y_edges = density_bins(x_values, y_values)
+    z = np.where(counts.T > 0, counts.T, np.nan)
+    fig = go.Figure(go.Heatmap(x=(x_edges[:-1] + x_edges[1:]) / 2, y=(y_edges[:-1] + y_edges[1:]) / 2, z=z,
+                               colorscale='Viridis', colorbar=dict(title='Count'),
+                               hovertemplate=f'{x_label}: %{{x}}<br>{y_label}: %{{y}}<br>Count: %{{z}}<extra></extra>'))
+    fig.update_layout(xaxis_title=x_label, yaxis_title=y_label)
+    return fig
+
+def figure_points(fig):
+    """Marks in fig: x values per trace, or z cells for heatmaps."""
+    points = 0
+    for trace in fig.data:
+        values = getattr(trace, 'z', None) if trace.type == 'heatmap' else getattr(trace, 'x', None)
+        if values is not None:
+            points += np.size(values)
+    return points
+
+def plotly_chart(fig, **kwargs):
+    """st.plotly_chart at full width, timed (serialization included) under the figure title."""
+    with timed('chart:render', title=fig.layout.title.text) as span:
+        if span.active:
+            span.set(rows=figure_points(fig))
+        st.plotly_chart(fig, use_container_width=True, **kwargs)
@@ -1,3 +1,5 @@
+import os
+
 TAB_NAMES = [
     "Overview",
     "SatType Analysis",
@@ -6,9 +8,37 @@ TAB_NAMES = [
     "Help / Glossary",
     "Satellite Size & Launch Trends",
     "Custom Analysis & Visualization",
+    "Object Hierarchy",
     "Data Source"
 ]
+# Module providing render_tab for each entry of TAB_NAMES, imported on first use.
+TAB_MODULES = [
+    "tabs.overview_tab",
+    "tabs.sattype_tab",
+    "tabs.advanced_filters_tab",
+    "tabs.raw_data_tab",
+    "tabs.help_tab",
+    "tabs.size_trends_tab",
+    "tabs.custom_analysis_tab",
+    "tabs.hierarchy_tab",
+    "tabs.data_source_tab"
+]
+# Render only the selected tab on each rerun; set to 0 to render every tab under st.tabs.
+LAZY_TABS = os.environ.get('SATEXPLORER_LAZY_TABS', '1') != '0'
 DATA_FILE = 'satcat.html'
+CACHE_DIR = '.satcat_cache'
+# Processes used to parse the catalog on a cache miss; 0 means one per CPU.
+PARSE_WORKERS = int(os.environ.get('SATEXPLORER_PARSE_WORKERS', '1')) or None
+# Scatter plots with more points than this are downsampled or drawn as a 2-D density in Custom Analysis.
+SCATTER_MAX_POINTS = int(os.environ.get('SATEXPLORER_SCATTER_POINTS', '20000'))
+# Background check of WEB_URL for a newer catalog, in hours; 0 disables scheduled checks (manual ones still run).
+REFRESH_INTERVAL_HOURS = float(os.environ.get('SATEXPLORER_REFRESH_HOURS', '0'))
+# First retry delay after a failed check; it doubles per consecutive failure, up to the interval (or 6 hours).
+REFRESH_RETRY_SECONDS = 60
+# Record wall time, rows and memory deltas of loading, tabs and charts, shown in a sidebar diagnostics panel.
+PERF_ENABLED = os.environ.get('SATEXPLORER_PERF', '0') != '0'
+# Also append each timing record as a JSON line to this file (e.g. for a metrics shipper).
+PERF_LOG_FILE = os.environ.get('SATEXPLORER_PERF_FILE') or None
 WEB_URL = 'https://planet4589.org/space/gcat/data/cats/satcat'
 SATCAT_URL = WEB_URL  # Alias for compatibility
 APP_TITLE = "SatExplorer: Global Satellite & Space Object Dashboard"
@@ -0,0 +1,55 @@
+import logging
+import threading
+
+from constants import DATA_FILE
+from satcat_core.dataset import SatcatDataset
+from satcat_core.loading import load_catalog
+from satcat_core.perf import timed
+
+logger = logging.getLogger(__name__)
+
+_current = None
+# Serializes loads so concurrent first requests parse once; readers never take it.
+_load_lock = threading.Lock()
+
+def _load(data_file):
+    # Streamlit-free, so the background refresh thread can call it; failures are logged and raised.
+    try:
+        with timed('load_catalog', source=data_file) as span:
+            df, update_date = load_catalog(data_file)
+            span.set(rows=len(df))
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("Could not load %s: %s", data_file, e)
+        raise
+    return df, update_date
+
+def _swap(df, update_date, data_file):
+    global _current
+    generation = _current.generation + 1 if _current is not None else 1
+    _current = SatcatDataset(df, update_date, data_file, generation)
+    return _current
+
+def get_dataset(data_file=DATA_FILE):
+    """
+    Returns the process-wide dataset for data_file, loading it on first use.
+    Raises FileNotFoundError or ValueError if the catalog cannot be loaded (the next call retries).
+    """
+    dataset = _current
+    if dataset is not None and dataset.source == data_file:
+        return dataset
+    with _load_lock:
+        dataset = _current
+        if dataset is None or dataset.source != data_file:
+            dataset = _swap(*_load(data_file), data_file)
+    return dataset
+
+def refresh_dataset(data_file=DATA_FILE, df=None, update_date=None):
+    """
+    Replaces the shared dataset with a freshly loaded one (or with df, if given) under the next generation.
+    Sessions holding the previous dataset keep a consistent snapshot until their next rerun.
+    Returns the new dataset. Raises FileNotFoundError or ValueError if loading fails; the previous dataset is kept.
+    """
+    with _load_lock:
+        if df is None:
+            df, update_date = _load(data_file)
+        return _swap(df, update_date, data_file)
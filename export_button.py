@@ -0,0 +1,32 @@
+import io
+
+import streamlit as st
+
+from satcat_core.export import EXPORT_FORMATS, pa, write_export
+from satcat_core.perf import timed
+
+FORMAT_LABELS = {'csv': "CSV", 'parquet': "Parquet", 'arrow': "Arrow IPC"}
+
+def render_export(dataset, key, rows=None, columns=None):
+    """
+    Download button for rows (positions in output order or a boolean mask, None = all) and columns (all if None)
+    of the dataset. The file is built only when the button is clicked, so reruns cost nothing.
+    """
+    formats = [fmt for fmt in EXPORT_FORMATS if fmt == 'csv' or pa is not None]
+    n_rows = len(dataset) if rows is None else int(rows.sum()) if rows.dtype == bool else len(rows)
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        fmt = st.selectbox("Export format", formats, format_func=FORMAT_LABELS.get, key=f'{key}_export_format',
+                           label_visibility='collapsed')
+    extension, mime = EXPORT_FORMATS[fmt]
+
+    def build():
+        # Streamlit keeps the whole payload in memory to serve it, so the file is built as bytes.
+        with io.BytesIO() as out, timed('export', n_rows, format=fmt) as span:
+            write_export(dataset.df, out, fmt, rows=rows, columns=columns)
+            span.set(bytes=out.tell())
+            return out.getvalue()
+
+    with col2:
+        st.download_button(f"Export {n_rows:,} rows", data=build, file_name=f'satcat_{key}{extension}', mime=mime,
+                           key=f'{key}_export', on_click='ignore', disabled=n_rows == 0)
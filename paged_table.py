@@ -0,0 +1,82 @@
+import numpy as np
+import streamlit as st
+
+from export_button import render_export
+
+PAGE_SIZES = [25, 50, 100, 250, 1000]
+CATALOG_ORDER = "(catalog order)"
+# Session state key of the sidebar search matches (row positions) that data tables are limited to, or None.
+SEARCH_ROWS_KEY = 'search_rows'
+
+def _as_mask(rows, n_rows):
+    if rows.dtype == bool:
+        return rows
+    mask = np.zeros(n_rows, dtype=bool)
+    mask[rows] = True
+    return mask
+
+def page_rows(dataset, rows=None, sort_by=None, descending=False):
+    """
+    Row positions of the table view in display order: rows (a boolean mask or positions, None = all rows)
+    ordered by sort_by through the dataset's cached sort order, so no sort runs on a rerun.
+    """
+    n_rows = len(dataset)
+    selected = None if rows is None else _as_mask(rows, n_rows)
+    if sort_by is None:
+        return np.arange(n_rows) if selected is None else np.flatnonzero(selected)
+    order = dataset.sort_order(sort_by, descending)
+    return order if selected is None else order[selected[order]]
+
+def render_paged_table(dataset, key, rows=None, columns=None, export=True):
+    """
+    Shows the rows (see page_rows) of the dataset one page at a time: only the visible page, projected to
+    the chosen columns, is sent to the browser. Offers column selection, sorting, page size and jump-to-row,
+    and unless export is False a download of every row of the view in its order and columns.
+    Widget keys are prefixed with key so several tables can share a page. Rows are further limited to the
+    sidebar search matches while that filter is on.
+    """
+    df = dataset.df
+    search_rows = st.session_state.get(SEARCH_ROWS_KEY)
+    if search_rows is not None:
+        search_mask = _as_mask(search_rows, len(dataset))
+        rows = search_mask if rows is None else search_mask & _as_mask(rows, len(dataset))
+    all_columns = list(dict.fromkeys(df.columns))
+    with st.expander("Table options"):
+        col1, col2, col3 = st.columns([3, 2, 1])
+        with col1:
+            shown = st.multiselect("Columns", all_columns, default=columns or all_columns, key=f'{key}_columns')
+        with col2:
+            sort_by = st.selectbox("Sort by", [CATALOG_ORDER] + all_columns, key=f'{key}_sort')
+        with col3:
+            descending = st.checkbox("Descending", key=f'{key}_desc')
+            page_size = st.selectbox("Rows per page", PAGE_SIZES, index=1, key=f'{key}_page_size')
+    positions = page_rows(dataset, rows, None if sort_by == CATALOG_ORDER else sort_by, descending)
+    total = len(positions)
+    n_pages = max(1, -(-total // page_size))
+    page_key = f'{key}_page'
+    jump_key = f'{key}_jump'
+    # Keep stored positions inside the current view when a filter shrinks it.
+    if st.session_state.get(page_key, 1) > n_pages:
+        st.session_state[page_key] = n_pages
+    if st.session_state.get(jump_key, 1) > max(1, total):
+        st.session_state[jump_key] = max(1, total)
+
+    def jump_to_row():
+        row = st.session_state[jump_key]
+        st.session_state[page_key] = min(n_pages, (row - 1) // page_size + 1)
+
+    col1, col2, col3 = st.columns([1, 1, 3])
+    with col1:
+        page = st.number_input("Page", min_value=1, max_value=n_pages, step=1, key=page_key)
+    with col2:
+        st.number_input("Go to row", min_value=1, max_value=max(1, total), step=1, key=jump_key, on_change=jump_to_row)
+    start = (page - 1) * page_size
+    visible = positions[start:start + page_size]
+    with col3:
+        st.caption(f"Rows {start + 1 if total else 0:,}–{start + len(visible):,} of {total:,} (page {page} of {n_pages})"
+                   + (" · limited to search matches" if search_rows is not None else ""))
+    # In the order the columns were picked, for the page and the export alike.
+    projection = df.columns.get_indexer(shown) if shown else np.arange(len(all_columns))
+    st.dataframe(df.iloc[visible, projection], use_container_width=True)
+    if export:
+        render_export(dataset, key, positions, df.columns[projection])
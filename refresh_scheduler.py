@@ -0,0 +1,115 @@
+import threading
+import time
+
+from constants import DATA_FILE, REFRESH_INTERVAL_HOURS, REFRESH_RETRY_SECONDS, SATCAT_URL
+from dataset import refresh_dataset
+from satcat_core.fetch import REFRESH_UPDATED, refresh_satcat_file
+
+MAX_RETRY_SECONDS = 6 * 3600
+
+class RefreshScheduler:
+    """
+    Daemon thread that checks web_url for a newer catalog every interval seconds (None: only when
+    triggered), downloads and parses it off the request path, and swaps it in with refresh_dataset.
+    Sessions pick the new dataset up on their next rerun. Failed checks are retried with exponential
+    back-off. status() is safe to read from any session.
+    """
+
+    def __init__(self, data_file=DATA_FILE, web_url=SATCAT_URL, interval=None, retry_seconds=REFRESH_RETRY_SECONDS):
+        self.data_file = data_file
+        self.web_url = web_url
+        self.interval = interval
+        self.retry_seconds = retry_seconds
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._status = {
+            'state': 'idle',
+            'last_check': None,
+            'last_result': None,
+            'last_update': None,
+            'last_error': None,
+            'failures': 0,
+            'next_check': None,
+            'generation': None,
+        }
+
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name='satcat-refresh', daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def trigger(self):
+        """Asks for a check now, without waiting for it."""
+        self.start()
+        self._wake.set()
+
+    def status(self):
+        with self._lock:
+            return dict(self._status)
+
+    def _set_status(self, **changes):
+        with self._lock:
+            self._status.update(changes)
+
+    def _next_delay(self, failures):
+        if failures:
+            cap = self.interval or MAX_RETRY_SECONDS
+            return min(self.retry_seconds * 2 ** (failures - 1), cap)
+        return self.interval
+
+    def check(self):
+        """Runs one check in the calling thread and records its outcome; returns the RefreshResult or None."""
+        self._set_status(state='checking', last_check=time.time())
+        try:
+            result = refresh_satcat_file(self.data_file, self.web_url)
+            if result.status == REFRESH_UPDATED:
+                self._set_status(state='parsing')
+                # A catalog that fails to load raises here and counts as a failed check for the back-off.
+                dataset = refresh_dataset(self.data_file)
+                self._set_status(last_update=time.time(), generation=dataset.generation)
+        except Exception as e:
+            with self._lock:
+                self._status.update(state='failed', last_error=str(e), failures=self._status['failures'] + 1)
+            return None
+        self._set_status(state='idle', last_result=result.status, last_error=None, failures=0)
+        return result
+
+    def _run(self):
+        while not self._stop.is_set():
+            delay = self._next_delay(self.status()['failures'])
+            self._set_status(next_check=time.time() + delay if delay is not None else None)
+            self._wake.wait(delay)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            self.check()
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler(data_file=DATA_FILE):
+    """
+    The process-wide scheduler for data_file. It is started on first use when SATEXPLORER_REFRESH_HOURS
+    sets an interval; otherwise it only runs checks that are triggered.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None or _scheduler.data_file != data_file:
+            if _scheduler is not None:
+                _scheduler.stop(timeout=0)
+            interval = REFRESH_INTERVAL_HOURS * 3600 if REFRESH_INTERVAL_HOURS > 0 else None
+            _scheduler = RefreshScheduler(data_file, interval=interval)
+            if interval is not None:
+                _scheduler.start()
+        return _scheduler
@@ -1,56 +1,70 @@
 import streamlit as st
 import pandas as pd
 import os
+import importlib
+import threading
+import time
 from datetime import datetime
 
-from data_loader import load_satcat_data, get_satcat_update_date
-from utils import get_date_confidence
-from constants import TAB_NAMES, APP_TITLE
+from dataset import get_dataset
+from refresh_scheduler import get_scheduler
+from search_sidebar import render_search
+from constants import TAB_NAMES, TAB_MODULES, LAZY_TABS, APP_TITLE, DATA_FILE, PERF_ENABLED
+from satcat_core.perf import recent_records, timed
+
+def load_tab_renderer(index):
+    """Imports the module of tab index (once per process) and returns its render_tab."""
+    return importlib.import_module(TAB_MODULES[index]).render_tab
 
 # Import tab renderers
 def import_tab_renderers():
-    from tabs.overview_tab import render_tab as render_overview
-    from tabs.sattype_tab import render_tab as render_sattype
-    from tabs.advanced_filters_tab import render_tab as render_advanced_filters
-    from tabs.raw_data_tab import render_tab as render_raw_data
-    from tabs.help_tab import render_tab as render_help
-    from tabs.size_trends_tab import render_tab as render_size_trends
-    from tabs.custom_analysis_tab import render_tab as render_custom_analysis
-    from tabs.data_source_tab import render_tab as render_data_source
-    return [
-        render_overview,
-        render_sattype,
-        render_advanced_filters,
-        render_raw_data,
-        render_help,
-        render_size_trends,
-        render_custom_analysis,
-        render_data_source
-    ]
+    return [load_tab_renderer(i) for i in range(len(TAB_NAMES))]
+
+def render_tab_timed(name, render_tab, dataset):
+    with timed(f'tab:{name}', len(dataset)):
+        render_tab(dataset)
+
+def render_selected_tab(dataset):
+    """Lazy mode: a tab selector in place of st.tabs, and only the selected tab's renderer runs."""
+    selected = st.radio("Tab", TAB_NAMES, horizontal=True, key='active_tab', label_visibility='collapsed')
+    st.divider()
+    render_tab_timed(selected, load_tab_renderer(TAB_NAMES.index(selected)), dataset)
+
+def render_diagnostics(run_start):
+    """Sidebar table of the timings recorded by this session's rerun (SATEXPLORER_PERF=1)."""
+    records = recent_records(since=run_start, thread=threading.get_ident())
+    with st.sidebar.expander("Diagnostics", expanded=False):
+        st.caption(f"Rerun: {(time.time() - run_start) * 1e3:,.0f} ms, {len(records)} timed steps")
+        if records:
+            table = pd.DataFrame(records)[['name', 'wall_ms', 'rows', 'rss_delta_mb']]
+            st.dataframe(table.round(2), hide_index=True, use_container_width=True)
 
 if __name__ == "__main__":
+    run_start = time.time()
     st.set_page_config(page_title=APP_TITLE, layout="wide", initial_sidebar_state="auto")
     st.title(APP_TITLE)
 
-    data_file = 'satcat.html'
-
-    df, file_update_date = load_satcat_data(data_file)
-
-    if df is None or df.empty:
-        st.warning("No data loaded from satcat.html.")
+    try:
+        dataset = get_dataset(DATA_FILE)
+    except FileNotFoundError as e:
+        st.error(str(e))
         st.stop()
-
-    # Add Date Confidence column if not present
-    if 'LDate' in df.columns and 'DateConfidence' not in df.columns:
-        df['DateConfidence'] = df['LDate'].apply(get_date_confidence)
+    except ValueError as e:
+        st.error(f"Failed to load or parse '{DATA_FILE}': {e}")
+        st.stop()
+    # Starts the background refresh thread once per process when a refresh interval is configured.
+    get_scheduler(DATA_FILE)
+    render_search(dataset)
 
     # Tabs
-    renderers = import_tab_renderers()
-    tabs = st.tabs(TAB_NAMES)
-    for i, render_tab in enumerate(renderers):
-        with tabs[i]:
-            if TAB_NAMES[i] == "Data Source":
-                render_tab(df, file_update_date)
-            else:
-                render_tab(df)
+    if LAZY_TABS:
+        render_selected_tab(dataset)
+    else:
+        renderers = import_tab_renderers()
+        tabs = st.tabs(TAB_NAMES)
+        for i, render_tab in enumerate(renderers):
+            with tabs[i]:
+                render_tab_timed(TAB_NAMES[i], render_tab, dataset)
     st.markdown('<div style="text-align:center; color:gray; margin-top:2em;">Made with ❤️ by Harsh Kumar</div>', unsafe_allow_html=True)
+    if PERF_ENABLED:
+        render_diagnostics(run_start)
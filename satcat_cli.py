@@ -0,0 +1,125 @@
+"""
+Batch summaries of the catalog without the Streamlit app, e.g. from cron:
+
+    python satcat_cli.py --data-file satcat.html --out-dir summaries --format csv [--fetch]
+
+Writes rows per launch year, per year and object type, per size class and per orbit class. With --export,
+writes catalog rows instead (optionally filtered and projected), e.g.
+
+    python satcat_cli.py --export debris.parquet --where CoarseType=D --columns '#JCAT,Name,Perigee,Apogee'
+"""
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from constants import CACHE_DIR, DATA_FILE, PARSE_WORKERS, WEB_URL
+from satcat_core.aggregates import build_trend_cube
+from satcat_core.loading import load_catalog
+
+logger = logging.getLogger('satcat_cli')
+
+# Output name -> trend cube dimensions it is grouped by.
+SUMMARIES = {
+    'per_year': ['LaunchYear'],
+    'per_year_type': ['LaunchYear', 'CoarseType'],
+    'size_class': ['SizeClass'],
+    'orbit_class': ['MainOrbitClass'],
+    'orbit': ['OpOrbitOQU'],
+}
+
+def build_summaries(df):
+    """{name: frame} of object counts and Mass totals for each entry of SUMMARIES."""
+    cube = build_trend_cube(df)
+    summaries = {}
+    for name, by in SUMMARIES.items():
+        if all(dim in cube.dims for dim in by):
+            summary = cube.query(by).rename(columns={'Mass_sum': 'MassTotal', 'Mass_count': 'MassKnown'})
+            # Catalog masses have at most a few decimals; drop the float64 summation residue (411018.00000000006).
+            summaries[name] = summary.round({'MassTotal': 3})
+    return summaries
+
+def write_summaries(summaries, out_dir, fmt='csv'):
+    """Writes each summary to out_dir/<name>.<fmt> and returns the paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for name, frame in summaries.items():
+        path = os.path.join(out_dir, f'{name}.{fmt}')
+        if fmt == 'json':
+            frame.to_json(path, orient='records', indent=1)
+        else:
+            frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+def where_mask(df, conditions):
+    """Boolean mask of the rows meeting every COLUMN=VALUE[,VALUE...] condition. Raises ValueError for a malformed one."""
+    mask = np.ones(len(df), dtype=bool)
+    for condition in conditions:
+        column, sep, values = condition.partition('=')
+        if not sep or column not in df.columns:
+            raise ValueError(f"Bad --where '{condition}': expected COLUMN=VALUE[,VALUE...] with a catalog column.")
+        series = df[column]
+        values = values.split(',')
+        if pd.api.types.is_numeric_dtype(series.dtype):
+            mask &= series.isin(pd.to_numeric(values, errors='coerce')).to_numpy(dtype=bool)
+        else:
+            mask &= series.astype(str).isin(values).to_numpy(dtype=bool)
+    return mask
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--data-file', default=DATA_FILE, help='catalog HTML file (default: %(default)s)')
+    parser.add_argument('--out-dir', default='summaries', help='directory for the summary files (default: %(default)s)')
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv')
+    parser.add_argument('--no-cache', action='store_true', help='parse the file even if the columnar cache matches')
+    parser.add_argument('--workers', type=int, default=PARSE_WORKERS, help='parse processes on a cache miss (0 = one per CPU)')
+    parser.add_argument('--fetch', action='store_true', help=f'download a newer catalog from {WEB_URL} first')
+    parser.add_argument('--export', metavar='PATH', help='write catalog rows to PATH (.csv, .parquet or .arrow) instead of the summaries')
+    parser.add_argument('--where', action='append', default=[], metavar='COLUMN=VALUES',
+                        help='with --export, keep rows whose COLUMN is one of the comma-separated VALUES (repeatable)')
+    parser.add_argument('--columns', help='with --export, comma-separated columns to write, in this order (default: all)')
+    parser.add_argument('-v', '--verbose', action='store_true')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(levelname)s %(name)s: %(message)s')
+    if args.fetch:
+        from satcat_core.fetch import refresh_satcat_file
+        try:
+            result = refresh_satcat_file(args.data_file, WEB_URL)
+            logger.info("Catalog refresh: %s (%d bytes downloaded)", result.status, result.bytes_downloaded)
+        except Exception as e:
+            logger.error("Could not refresh %s: %s", args.data_file, e)
+            if not os.path.exists(args.data_file):
+                return 1
+    try:
+        df, update_date = load_catalog(args.data_file, use_cache=not args.no_cache, workers=args.workers or None,
+                                       cache_dir=CACHE_DIR)
+    except (FileNotFoundError, ValueError) as e:
+        logger.error("%s", e)
+        return 1
+    if args.export:
+        from satcat_core.export import export_format, write_export
+        fmt = export_format(args.export)
+        if fmt is None:
+            logger.error("Cannot tell the export format of %s: use a .csv, .parquet or .arrow file name.", args.export)
+            return 1
+        try:
+            rows = where_mask(df, args.where) if args.where else None
+            written = write_export(df, args.export, fmt, rows=rows, columns=args.columns.split(',') if args.columns else None)
+        except (ValueError, ImportError, OSError) as e:
+            logger.error("Cannot export to %s: %s", args.export, e)
+            return 1
+        print(f"{len(df)} objects (catalog updated {update_date or 'unknown'}): wrote {written} rows to {args.export}")
+        return 0
+    paths = write_summaries(build_summaries(df), args.out_dir, args.format)
+    print(f"{len(df)} objects (catalog updated {update_date or 'unknown'}): wrote {', '.join(paths)}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
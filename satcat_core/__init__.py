@@ -0,0 +1,5 @@
+"""
+Streamlit-free catalog core: parsing, derived columns, the columnar cache, download, filter masks and
+aggregate cubes. Errors are raised or logged, never drawn, so the app, the CLI and cron jobs share it.
+Submodules are imported directly (e.g. satcat_core.loading.load_catalog) to keep cold starts cheap.
+"""
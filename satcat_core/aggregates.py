@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+
+from satcat_core.classify import classify_size_class
+from satcat_core.perf import instrumented
+
+TOP_MANUFACTURERS = 50
+OTHER_LABEL = 'Other'
+
+TREND_DIMENSIONS = ['LaunchYear', 'CoarseType', 'SizeClass', 'OpOrbitOQU', 'MainOrbitClass', 'Manufacturer']
+SATTYPE_DIMENSIONS = ['LaunchYear', 'CoarseType', 'SatType_1', 'SatType_2', 'SatType_1_2', 'SatType_3']
+
+def _combine_codes(codes, sizes):
+    """One int64 key per row from per-dimension codes (0 = missing), or None if the key space would overflow."""
+    if np.prod([float(size) for size in sizes]) >= 2 ** 62:
+        return None
+    return np.ravel_multi_index(codes, sizes)
+
+class AggregateCube:
+    """
+    Row counts and measure sums of a frame, grouped by every combination of dims that occurs in it.
+    Only occupied cells are stored (one row per cell, a small int code per dimension), so a query costs
+    a pass over the cells rather than over the catalog. Missing values get code 0 and are kept as their
+    own cell, but are dropped from the groups of a query, like groupby does.
+    """
+
+    def __init__(self, df, dims, measures=()):
+        self.dims = [dim for dim in dims if dim in df.columns]
+        self.measures = [measure for measure in measures if measure in df.columns]
+        self.categories = {}
+        codes = []
+        for dim in self.dims:
+            cat = pd.Categorical(df[dim])
+            if isinstance(df[dim].dtype, pd.CategoricalDtype):
+                cat = cat.remove_unused_categories()
+            self.categories[dim] = cat.categories
+            codes.append(cat.codes.astype(np.int64) + 1)
+        sizes = [len(self.categories[dim]) + 1 for dim in self.dims]
+        keys = _combine_codes(codes, sizes)
+        if keys is None:
+            cells, inverse = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+            cell_codes = cells.T
+        else:
+            cell_keys, inverse = np.unique(keys, return_inverse=True)
+            cell_codes = np.unravel_index(cell_keys, sizes)
+        inverse = inverse.ravel()
+        n_cells = len(cell_codes[0]) if self.dims else 1
+        self.cells = pd.DataFrame({dim: np.asarray(c, dtype=np.int32) for dim, c in zip(self.dims, cell_codes)})
+        self.cells['Count'] = np.bincount(inverse, minlength=n_cells)
+        for measure in self.measures:
+            values = df[measure].to_numpy(dtype='float64', na_value=np.nan)
+            present = ~np.isnan(values)
+            self.cells[f'{measure}_sum'] = np.bincount(inverse, weights=np.where(present, values, 0), minlength=n_cells)
+            self.cells[f'{measure}_count'] = np.bincount(inverse, weights=present, minlength=n_cells).astype(np.int64)
+
+    def __len__(self):
+        return len(self.cells)
+
+    def values(self, dim):
+        """Category values of dim present in the cube."""
+        return self.categories[dim]
+
+    def _cell_mask(self, years=None, filters=None):
+        mask = np.ones(len(self.cells), dtype=bool)
+        if years is not None and 'LaunchYear' in self.categories:
+            labels = np.concatenate([[np.nan], self.categories['LaunchYear'].to_numpy(dtype='float64')])
+            cell_years = labels[self.cells['LaunchYear'].to_numpy()]
+            mask &= (cell_years >= years[0]) & (cell_years <= years[1])
+        for dim, selected in (filters or {}).items():
+            wanted = self.categories[dim].get_indexer(list(selected))
+            mask &= np.isin(self.cells[dim].to_numpy(), wanted[wanted >= 0] + 1)
+        return mask
+
+    def query(self, by, years=None, filters=None):
+        """
+        Sums the cells with LaunchYear in years (inclusive) and every {dim: values} filter, grouped by the by dims.
+        Returns a frame with the by columns, Count, and <measure>_sum / <measure>_count per measure.
+        """
+        cells = self.cells[self._cell_mask(years, filters)]
+        totals = ['Count'] + [f'{m}_{agg}' for m in self.measures for agg in ('sum', 'count')]
+        codes = [cells[dim].to_numpy() for dim in by]
+        keep = np.logical_and.reduce([c > 0 for c in codes]) if by else np.ones(len(cells), dtype=bool)
+        codes = [c[keep] for c in codes]
+        cells = cells[keep]
+        sizes = [len(self.categories[dim]) + 1 for dim in by]
+        group_keys, inverse = np.unique(np.ravel_multi_index(codes, sizes) if by else np.zeros(len(cells), dtype=np.int64),
+                                        return_inverse=True)
+        inverse = inverse.ravel()
+        result = {}
+        for dim, group_codes in zip(by, np.unravel_index(group_keys, sizes) if by else []):
+            result[dim] = self.categories[dim].take(group_codes - 1)
+        for total in totals:
+            summed = np.bincount(inverse, weights=cells[total].to_numpy(dtype='float64'), minlength=len(group_keys))
+            result[total] = summed if total.endswith('_sum') else summed.astype(np.int64)
+        return pd.DataFrame(result)
+
+def trend_dimensions(df, top_manufacturers=TOP_MANUFACTURERS):
+    """
+    The trend cube dimensions of df: SizeClass from Mass, MainOrbitClass (the part of OpOrbitOQU before '/'),
+    and Manufacturer folded to its top_manufacturers values plus OTHER_LABEL.
+    """
+    dims = df[[col for col in ['LaunchYear', 'CoarseType', 'OpOrbitOQU', 'Mass'] if col in df.columns]].copy(deep=False)
+    if 'Mass' in df.columns:
+        dims['SizeClass'] = classify_size_class(df['Mass'])
+    if 'OpOrbitOQU' in df.columns:
+        orbit = df['OpOrbitOQU'].astype('category')
+        main_classes = orbit.cat.categories.astype(str).str.split('/').str[0]
+        codes = orbit.cat.codes.to_numpy()
+        dims['MainOrbitClass'] = pd.Categorical(np.where(codes >= 0, np.asarray(main_classes, dtype=object)[codes], None))
+    if 'Manufacturer' in df.columns:
+        counts = df['Manufacturer'].value_counts()
+        top = counts.index[:top_manufacturers]
+        manufacturer = df['Manufacturer'].astype(object)
+        dims['Manufacturer'] = manufacturer.where(manufacturer.isin(top) | manufacturer.isna(), OTHER_LABEL)
+    return dims
+
+@instrumented('build_trend_cube')
+def build_trend_cube(df, top_manufacturers=TOP_MANUFACTURERS):
+    """Cube of counts and Mass sums over TREND_DIMENSIONS."""
+    return AggregateCube(trend_dimensions(df, top_manufacturers), TREND_DIMENSIONS, measures=['Mass'])
+
+@instrumented('build_sattype_cube')
+def build_sattype_cube(df):
+    """Cube of counts over the first SatType bytes (SATTYPE_DIMENSIONS)."""
+    return AggregateCube(df, SATTYPE_DIMENSIONS)
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+# Upper bound on histogram bins, so a long-tailed column cannot blow up the figure.
+MAX_BINS = 1000
+AGGREGATIONS = ['count', 'sum', 'mean', 'median']
+DENSITY_BINS = 100
+# Aggregated bar/line/pie charts keep at most this many x values (the largest totals).
+MAX_GROUPS = 500
+
+def _selected(values, mask):
+    return values if mask is None else values[mask]
+
+def category_counts(series, mask=None):
+    """
+    Rows per value of series (optionally within a boolean row mask), most common first, as a frame with the
+    value column and Count. Counts come from np.bincount over the categorical codes; missing values are dropped.
+    """
+    cat = series.array if isinstance(series.dtype, pd.CategoricalDtype) else pd.Categorical(series)
+    codes = _selected(np.asarray(cat.codes), mask)
+    counts = np.bincount(codes[codes >= 0], minlength=len(cat.categories))
+    present = np.flatnonzero(counts)
+    order = present[np.argsort(-counts[present], kind='stable')]
+    return pd.DataFrame({series.name: cat.categories.take(order), 'Count': counts[order]})
+
+def freedman_diaconis_bins(data):
+    """Number of bins for data from the Freedman–Diaconis width (a twentieth of the range if the IQR is 0)."""
+    if len(data) <= 1:
+        return 10
+    q75, q25 = np.percentile(data, [75, 25])
+    iqr = q75 - q25
+    bin_width = 2 * iqr / (len(data) ** (1/3)) if iqr > 0 else (data.max() - data.min()) / 20
+    if bin_width > 0:
+        return min(MAX_BINS, int(np.ceil((data.max() - data.min()) / bin_width)))
+    return 10
+
+def numeric_histogram(series, mask=None, bins=None):
+    """(edges, counts) of the non-missing values of series (optionally within mask), binned with np.histogram."""
+    values = _selected(series.to_numpy(dtype='float64', na_value=np.nan), mask)
+    values = values[~np.isnan(values)]
+    if bins is None:
+        bins = freedman_diaconis_bins(values)
+    counts, edges = np.histogram(values, bins=bins)
+    return edges, counts
+
+def density_bins(x_values, y_values, bins=DENSITY_BINS):
+    """(counts, x_edges, y_edges) of the rows where both x and y are present, binned with np.histogram2d."""
+    x_values = pd.Series(x_values).to_numpy(dtype='float64', na_value=np.nan)
+    y_values = pd.Series(y_values).to_numpy(dtype='float64', na_value=np.nan)
+    present = ~(np.isnan(x_values) | np.isnan(y_values))
+    return np.histogram2d(x_values[present], y_values[present], bins=bins)
+
+def aggregate_xy(df, x, y=None, color=None, how='count'):
+    """
+    One row per x value (and color group) with y aggregated by how: 'count' counts rows, the others reduce y.
+    Rows with a missing x or group are dropped, as px would drop them.
+    """
+    keys = [x] + ([color] if color and color not in (x, y) else [])
+    grouped = df.groupby(keys, observed=True, sort=True)
+    if how == 'count' or y is None:
+        result = grouped.size().rename('Count')
+    else:
+        result = grouped[y].agg(how).rename(y)
+    return result.reset_index()
+
+def top_groups(agg_df, x, value, limit=MAX_GROUPS):
+    """agg_df limited to the limit x values with the largest total value, and whether any were dropped."""
+    totals = agg_df.groupby(x, observed=True)[value].sum()
+    if len(totals) <= limit:
+        return agg_df, False
+    keep = totals.abs().nlargest(limit).index
+    return agg_df[agg_df[x].isin(keep)], True
+
+def downsample_rows(n_rows, limit, seed=0):
+    """Sorted positions of a uniform random sample of limit out of n_rows rows (all rows if within limit)."""
+    if n_rows <= limit:
+        return np.arange(n_rows)
+    return np.sort(np.random.default_rng(seed).choice(n_rows, size=limit, replace=False))
@@ -0,0 +1,100 @@
+import hashlib
+import json
+import logging
+import os
+import pandas as pd
+
+from constants import CACHE_DIR
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever parsing or derived columns change so stale caches are rebuilt.
+CACHE_SCHEMA_VERSION = 6
+
+def _hash_file(filepath, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _cache_paths(data_file, cache_dir):
+    base = os.path.join(cache_dir, os.path.basename(data_file))
+    return base + '.parquet', base + '.json'
+
+def _read_cache_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_atomic(path, write):
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def _write_cache_meta(meta_path, meta):
+    def write(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    _write_atomic(meta_path, write)
+
+def load_cached_satcat(data_file, cache_dir=CACHE_DIR):
+    """
+    Returns (DataFrame, update_date_str) from the columnar cache if it matches data_file, else (None, None).
+    The cache is keyed on schema version, file size, mtime and SHA-256 of the content. The content hash is
+    only recomputed when size or mtime differ, so an identical re-download still hits the cache.
+    """
+    if pyarrow is None:
+        return None, None
+    parquet_path, meta_path = _cache_paths(data_file, cache_dir)
+    meta = _read_cache_meta(meta_path)
+    if not meta or meta.get('schema') != CACHE_SCHEMA_VERSION or not os.path.exists(parquet_path):
+        return None, None
+    try:
+        stat = os.stat(data_file)
+    except OSError:
+        return None, None
+    if (meta.get('size'), meta.get('mtime_ns')) != (stat.st_size, stat.st_mtime_ns):
+        if meta.get('size') != stat.st_size or meta.get('sha256') != _hash_file(data_file):
+            return None, None
+        meta.update(mtime_ns=stat.st_mtime_ns)
+        _write_cache_meta(meta_path, meta)
+    try:
+        df = pd.read_parquet(parquet_path)
+    except Exception as e:
+        logger.warning("Ignoring unreadable cache %s: %s", parquet_path, e)
+        return None, None
+    return df, meta.get('update_date')
+
+def save_cached_satcat(data_file, df, update_date, cache_dir=CACHE_DIR):
+    """Writes the derived DataFrame to the columnar cache. Failures only cost a re-parse next time."""
+    if pyarrow is None:
+        return False
+    parquet_path, meta_path = _cache_paths(data_file, cache_dir)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        stat = os.stat(data_file)
+        meta = {
+            'schema': CACHE_SCHEMA_VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': _hash_file(data_file),
+            'update_date': update_date,
+        }
+        _write_atomic(parquet_path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+        _write_cache_meta(meta_path, meta)
+        return True
+    except Exception as e:
+        logger.warning("Could not write cache for %s: %s", data_file, e)
+        return False
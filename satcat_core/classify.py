@@ -0,0 +1,76 @@
+import re
+import numpy as np
+import pandas as pd
+
+DATE_CONFIDENCE_LEVELS = [
+    "Exact to second",
+    "Exact to minute",
+    "Exact to day",
+    "Exact to month",
+    "Exact to year",
+    "Scheduled (not confirmed)",
+    "Uncertain",
+    "Other/Unknown",
+    "Unknown",
+]
+
+# (level, pattern, is_regex) in the priority order of get_date_confidence.
+_DATE_CONFIDENCE_RULES = [
+    ("Uncertain", '?', False),
+    ("Scheduled (not confirmed)", 's', False),
+    ("Exact to second", r'\d{4} [A-Za-z]{3} \d{1,2} \d{4}:\d{2}:\d{2}', True),
+    ("Exact to minute", r'\d{4} [A-Za-z]{3} \d{1,2} \d{4}', True),
+    ("Exact to day", r'\d{4} [A-Zael]{3} \d{1,2}', True),
+    ("Exact to month", r'\d{4} [A-Za-z]{3}', True),
+    ("Exact to year", r'\d{4}', True),
+]
+
+def get_date_confidence(ldate):
+    if pd.isna(ldate):
+        return "Unknown"
+    s = str(ldate)
+    if '?' in s:
+        return "Uncertain"
+    if 's' in s:
+        return "Scheduled (not confirmed)"
+    if re.search(r'\d{4} [A-Za-z]{3} \d{1,2} \d{4}:\d{2}:\d{2}', s):
+        return "Exact to second"
+    if re.search(r'\d{4} [A-Za-z]{3} \d{1,2} \d{4}', s):
+        return "Exact to minute"
+    if re.search(r'\d{4} [A-Zael]{3} \d{1,2}', s):
+        return "Exact to day"
+    if re.search(r'\d{4} [A-Za-z]{3}', s):
+        return "Exact to month"
+    if re.search(r'\d{4}', s):
+        return "Exact to year"
+    return "Other/Unknown"
+
+def classify_date_confidence(ldates):
+    """
+    Vectorized get_date_confidence for a whole Series of vague dates, returned as a categorical Series
+    with DATE_CONFIDENCE_LEVELS. Each rule is one column-wide str.contains pass (native on Arrow strings)
+    and np.select keeps the first matching rule per row.
+    """
+    conditions = [ldates.str.contains(pattern, regex=is_regex, na=False).to_numpy(dtype=bool)
+                  for _, pattern, is_regex in _DATE_CONFIDENCE_RULES]
+    choices = [DATE_CONFIDENCE_LEVELS.index(level) for level, _, _ in _DATE_CONFIDENCE_RULES]
+    codes = np.select(conditions, choices, default=DATE_CONFIDENCE_LEVELS.index("Other/Unknown"))
+    codes[ldates.isna().to_numpy()] = DATE_CONFIDENCE_LEVELS.index("Unknown")
+    return pd.Series(pd.Categorical.from_codes(codes, categories=DATE_CONFIDENCE_LEVELS), index=ldates.index)
+
+def size_class(mass):
+    if pd.isna(mass): return 'Unknown'
+    if mass <= 16: return 'CubeSat'
+    if mass <= 100: return 'MicroSat'
+    if mass <= 500: return 'SmallSat'
+    if mass <= 1000: return 'MediumSat'
+    return 'LargeSat'
+
+SIZE_CLASSES = ['CubeSat', 'MicroSat', 'SmallSat', 'MediumSat', 'LargeSat', 'Unknown']
+_SIZE_CLASS_BINS = [-np.inf, 16, 100, 500, 1000, np.inf]
+
+def classify_size_class(mass):
+    """Vectorized size_class for a Series of masses, returned as a categorical Series with SIZE_CLASSES."""
+    codes = pd.cut(mass.astype('float64'), _SIZE_CLASS_BINS, labels=False).to_numpy()
+    codes = np.where(np.isnan(codes), SIZE_CLASSES.index('Unknown'), codes).astype(np.int8)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=SIZE_CLASSES), index=mass.index)
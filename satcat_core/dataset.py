@@ -0,0 +1,116 @@
+from functools import cached_property
+
+import pandas as pd
+
+from satcat_core.aggregates import build_sattype_cube, build_trend_cube
+from satcat_core.filters import FilterEngine
+from satcat_core.hierarchy import HierarchyIndex
+from satcat_core.orbits import AltitudeIndex
+from satcat_core.perf import timed
+from satcat_core.search import SearchIndex
+from satcat_core.sattype_index import SatTypeIndex
+from satcat_core.sorted_index import SortedIndex
+from satcat_core.stats import ColumnStats
+
+# With copy-on-write (always on from pandas 3) a frame derived from the shared one is a lazy view
+# that copies on first write, so no session can modify the data other sessions are reading.
+if int(pd.__version__.split('.')[0]) < 3:
+    try:
+        pd.set_option('mode.copy_on_write', True)
+    except KeyError:
+        pass
+
+class SatcatDataset:
+    """
+    A loaded catalog shared read-only by every session in the process.
+    Instances never change; a refresh builds a new one with the next generation number and swaps it in.
+    """
+
+    def __init__(self, df, update_date, source, generation):
+        self._df = df
+        self.update_date = update_date
+        self.source = source
+        self.generation = generation
+        self._sorted_indexes = {}
+        self._sort_orders = {}
+
+    @property
+    def df(self):
+        return self._df
+
+    def view(self):
+        """Shallow view of the catalog frame; it shares memory with the dataset and copies only on write."""
+        return self._df.copy(deep=False)
+
+    def __len__(self):
+        return len(self._df)
+
+    @cached_property
+    def sattype_index(self):
+        """SatTypeIndex over the Type column, built on first use (None if there is no Type column)."""
+        return SatTypeIndex(self._df['Type']) if 'Type' in self._df.columns else None
+
+    @cached_property
+    def filters(self):
+        """FilterEngine resolving filter specs to cached row masks for this dataset."""
+        return FilterEngine(self)
+
+    @cached_property
+    def trend_cube(self):
+        """AggregateCube of counts and Mass sums by year, type, size class, orbit class and manufacturer."""
+        return build_trend_cube(self._df)
+
+    @cached_property
+    def sattype_cube(self):
+        """AggregateCube of counts by year and the first SatType bytes."""
+        return build_sattype_cube(self._df)
+
+    @cached_property
+    def stats(self):
+        """ColumnStats with per-column partial statistics per LaunchYear x CoarseType partition."""
+        with timed('build_column_stats', len(self._df)):
+            return ColumnStats(self._df)
+
+    @cached_property
+    def altitude_index(self):
+        """AltitudeIndex of the perigee-apogee intervals (None without Perigee/Apogee columns)."""
+        df = self._df
+        if 'Perigee' not in df.columns or 'Apogee' not in df.columns:
+            return None
+        return AltitudeIndex(df['Perigee'], df['Apogee'], df['Inc'] if 'Inc' in df.columns else None)
+
+    @cached_property
+    def hierarchy(self):
+        """HierarchyIndex of parent pointers and child adjacency from Parent (None without #JCAT/Parent columns)."""
+        df = self._df
+        if '#JCAT' not in df.columns or 'Parent' not in df.columns:
+            return None
+        with timed('build_hierarchy_index', len(df)):
+            return HierarchyIndex(df)
+
+    @cached_property
+    def debris_clouds(self):
+        """HierarchyIndex.fragment_counts by CoarseType: one row per root object with descendants, largest first."""
+        return None if self.hierarchy is None else self.hierarchy.fragment_counts(self._df)
+
+    @cached_property
+    def search_index(self):
+        """SearchIndex over identifiers (JCAT, catalog number, designator) and names, built on first search."""
+        with timed('build_search_index', len(self._df)):
+            return SearchIndex(self._df)
+
+    def sorted_index(self, column):
+        """SortedIndex over a numeric or datetime column (e.g. LaunchYear, LDate_DT), built on first use."""
+        index = self._sorted_indexes.get(column)
+        if index is None:
+            index = self._sorted_indexes.setdefault(column, SortedIndex(self._df[column]))
+        return index
+
+    def sort_order(self, column, descending=False):
+        """Row positions ordered by column (stable, missing values last), computed once per column and direction."""
+        order = self._sort_orders.get((column, descending))
+        if order is None:
+            values = self._df[column].reset_index(drop=True)
+            order = values.sort_values(ascending=not descending, kind='stable', na_position='last').index.to_numpy()
+            order = self._sort_orders.setdefault((column, descending), order)
+        return order
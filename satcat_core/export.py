@@ -0,0 +1,110 @@
+import io
+import os
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Rows converted and written at a time. Memory use is bounded by one chunk, not by the export size, at some cost in
+# speed against one to_csv/to_parquet of a copy (benchmarks/bench_export.py).
+EXPORT_CHUNK_ROWS = 10_000
+# Format -> (file extension, MIME type).
+EXPORT_FORMATS = {
+    'csv': ('.csv', 'text/csv'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'arrow': ('.arrow', 'application/vnd.apache.arrow.file'),
+}
+
+def export_format(path):
+    """Export format of a file name by its extension (.csv, .parquet, .arrow/.feather), or None."""
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension == '.feather':
+        return 'arrow'
+    return next((fmt for fmt, (ext, _) in EXPORT_FORMATS.items() if ext == extension), None)
+
+def _projection(df, columns):
+    """
+    Positions of columns in df, in the order given with repeats dropped (all columns if None).
+    Raises ValueError for unknown names.
+    """
+    if columns is None:
+        return np.arange(len(df.columns))
+    columns = list(dict.fromkeys(columns))
+    projection = df.columns.get_indexer(columns)
+    missing = [column for column, position in zip(columns, projection) if position == -1]
+    if missing:
+        raise ValueError(f"Unknown column(s): {', '.join(map(str, missing))}.")
+    return projection
+
+def iter_chunks(df, rows=None, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Frames of at most chunk_rows of df, for the row positions rows (a boolean mask or positions in output
+    order, None = all rows) and the columns listed, in that order and each once (all if None). Only the
+    current chunk is copied. Raises ValueError for a column df does not have.
+    """
+    if rows is None:
+        rows = np.arange(len(df))
+    elif rows.dtype == bool:
+        rows = np.flatnonzero(rows)
+    projection = _projection(df, columns)
+    for start in range(0, len(rows), chunk_rows):
+        yield df.iloc[rows[start:start + chunk_rows], projection]
+
+def _arrow_schema(df, projection):
+    # Taken from the full columns so every chunk gets the same types (a chunk of missing values has none of its own).
+    schema = pa.Schema.from_pandas(df.iloc[:0, projection], preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+def write_export(df, out, fmt='csv', rows=None, columns=None, chunk_rows=EXPORT_CHUNK_ROWS):
+    """
+    Writes the selected rows and columns of df (see iter_chunks) to out, a path or binary file object, as CSV,
+    Parquet or an Arrow IPC file, one chunk at a time. Returns the number of rows written.
+    Raises ValueError for an unknown format or column and ImportError if Parquet/Arrow is requested without
+    pyarrow, before anything is written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}' (expected one of {', '.join(EXPORT_FORMATS)}).")
+    if fmt != 'csv' and pa is None:
+        raise ImportError(f"Exporting {fmt} requires pyarrow.")
+    projection = _projection(df, columns)
+    handle = open(out, 'wb') if isinstance(out, (str, os.PathLike)) else out
+    written = 0
+    try:
+        chunks = iter_chunks(df, rows, df.columns[projection], chunk_rows)
+        if fmt == 'csv':
+            text = io.TextIOWrapper(handle, encoding='utf-8', newline='')
+            try:
+                header = True
+                for chunk in chunks:
+                    chunk.to_csv(text, index=False, header=header)
+                    header = False
+                    written += len(chunk)
+                if header:
+                    df.iloc[:0, projection].to_csv(text, index=False)
+            finally:
+                # Leave handle open for the caller.
+                text.flush()
+                text.detach()
+            return written
+        schema = _arrow_schema(df, projection)
+        if fmt == 'parquet':
+            writer = pq.ParquetWriter(handle, schema)
+        else:
+            # LZ4 record batches, as pandas' to_feather writes them.
+            compression = 'lz4' if pa.Codec.is_available('lz4') else None
+            writer = pa.ipc.new_file(handle, schema, options=pa.ipc.IpcWriteOptions(compression=compression))
+        with writer:
+            for chunk in chunks:
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+                written += len(chunk)
+        return written
+    finally:
+        if handle is not out:
+            handle.close()
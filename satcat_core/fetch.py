@@ -0,0 +1,117 @@
+import hashlib
+import os
+import threading
+from collections import namedtuple
+
+from constants import CACHE_DIR
+from satcat_core.cache import _cache_paths, _hash_file, _read_cache_meta, _write_cache_meta
+from satcat_core.parsing import _header_columns, _locate_data_section, get_satcat_update_date
+
+try:
+    import requests
+    import requests.adapters
+except ImportError:
+    requests = None
+
+# Outcomes of refresh_satcat_file.
+REFRESH_NOT_MODIFIED = 'not_modified'  # the server answered 304, nothing was downloaded
+REFRESH_UNCHANGED = 'unchanged'  # downloaded, but identical to the local file
+REFRESH_UPDATED = 'updated'  # the local file was replaced
+
+RefreshResult = namedtuple('RefreshResult', ['status', 'update_date', 'sha256', 'bytes_downloaded'])
+
+DOWNLOAD_CHUNK_BYTES = 1 << 16
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def get_http_session():
+    """The process-wide pooled requests.Session used for catalog downloads."""
+    global _http_session
+    with _http_session_lock:
+        if _http_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=2)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _http_session = session
+        return _http_session
+
+def _http_meta_path(data_file, cache_dir):
+    return os.path.join(cache_dir, os.path.basename(data_file) + '.http.json')
+
+def _local_sha256(data_file, cache_dir):
+    """SHA-256 of data_file, taken from the parse cache metadata when its size and mtime still match."""
+    if not os.path.exists(data_file):
+        return None
+    meta = _read_cache_meta(_cache_paths(data_file, cache_dir)[1]) or {}
+    stat = os.stat(data_file)
+    if (meta.get('size'), meta.get('mtime_ns')) == (stat.st_size, stat.st_mtime_ns) and meta.get('sha256'):
+        return meta['sha256']
+    return _hash_file(data_file)
+
+def _check_catalog(path, update_date):
+    """Raises ValueError unless path looks like a SATCAT file: an '# Updated' date or a #JCAT header block."""
+    if update_date is not None:
+        return
+    try:
+        with open(path, 'rb') as f:
+            header_text, _, _ = _locate_data_section(f)
+        column_names = _header_columns(header_text)[1]
+    except (ValueError, UnicodeDecodeError):
+        column_names = []
+    if '#JCAT' not in column_names[:1]:
+        raise ValueError("The download is not a SATCAT file (no '# Updated' date or #JCAT header); keeping the local copy.")
+
+def refresh_satcat_file(data_file, web_url, cache_dir=CACHE_DIR, session=None, timeout=30):
+    """
+    Brings data_file up to date with web_url and returns a RefreshResult; raises on network or I/O errors.
+    Sends the ETag / Last-Modified validators from the previous download, so an unchanged catalog costs a 304.
+    Otherwise the body is streamed to a temporary file next to data_file while being hashed, and only
+    replaces data_file (atomically, with os.replace) when the content differs from the local copy.
+    A body that is not a SATCAT file (an error page from a proxy, say) raises ValueError and leaves both
+    data_file and the stored validators as they were.
+    """
+    if requests is None:
+        raise RuntimeError("The 'requests' library is required to download the file.")
+    session = session or get_http_session()
+    meta_path = _http_meta_path(data_file, cache_dir)
+    http_meta = _read_cache_meta(meta_path) or {}
+    local_sha256 = _local_sha256(data_file, cache_dir)
+    headers = {}
+    if local_sha256 is not None and http_meta.get('sha256') == local_sha256:
+        if http_meta.get('etag'):
+            headers['If-None-Match'] = http_meta['etag']
+        if http_meta.get('last_modified'):
+            headers['If-Modified-Since'] = http_meta['last_modified']
+    with session.get(web_url, headers=headers, stream=True, timeout=timeout) as resp:
+        if resp.status_code == 304:
+            return RefreshResult(REFRESH_NOT_MODIFIED, get_satcat_update_date(data_file), local_sha256, 0)
+        resp.raise_for_status()
+        digest = hashlib.sha256()
+        size = 0
+        tmp_path = f"{data_file}.{os.getpid()}.download"
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            sha256 = digest.hexdigest()
+            update_date = get_satcat_update_date(tmp_path)
+            _check_catalog(tmp_path, update_date)
+            if sha256 == local_sha256:
+                status = REFRESH_UNCHANGED
+            else:
+                os.replace(tmp_path, data_file)
+                status = REFRESH_UPDATED
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        http_meta = {'etag': resp.headers.get('ETag'), 'last_modified': resp.headers.get('Last-Modified'), 'sha256': sha256}
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_cache_meta(meta_path, http_meta)
+    except OSError:
+        pass
+    return RefreshResult(status, update_date, sha256, size)
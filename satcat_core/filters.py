@@ -0,0 +1,113 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MASK_CACHE_SIZE = 64
+# Columns with more distinct values than this are matched with isin instead of per-value masks.
+MAX_MASKED_VALUES = 256
+
+def isin(values):
+    """Condition: the column value is one of values (order does not matter)."""
+    return ('in', frozenset(values))
+
+def between(low=None, high=None):
+    """Condition: low <= value <= high on a numeric or datetime column; a None bound is open."""
+    return ('between', low, high)
+
+def make_spec(conditions):
+    """
+    Normalizes a {column: condition} mapping (conditions from isin / between; None entries are dropped)
+    into the hashable, order-independent filter spec used as the cache key.
+    """
+    return tuple(sorted((column, condition) for column, condition in conditions.items() if condition is not None))
+
+class FilterEngine:
+    """
+    Resolves filter specs against one dataset into boolean row masks or row positions.
+    isin conditions OR together per-value masks packed once per column; between conditions use the dataset's
+    sorted indexes. Masks of whole specs and of single conditions are kept in an LRU cache, so tabs and sessions
+    repeating or sharing a filter get the stored, read-only mask back.
+    """
+
+    def __init__(self, dataset, cache_size=MASK_CACHE_SIZE):
+        self.dataset = dataset
+        self.n_rows = len(dataset)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._value_masks = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key, compute):
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self._cache.move_to_end(key)
+                return value
+        value = compute()
+        value.setflags(write=False)
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return value
+
+    def value_masks(self, column):
+        """Packed bitmap of every value of column, built on first use; None for high-cardinality columns."""
+        if column not in self._value_masks:
+            values = self.dataset.df[column]
+            cat = values.array if isinstance(values.dtype, pd.CategoricalDtype) else pd.Categorical(values)
+            if len(cat.categories) > MAX_MASKED_VALUES:
+                return self._value_masks.setdefault(column, None)
+            codes = np.asarray(cat.codes)
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(cat.categories) + 1))
+            masks = {}
+            for i, value in enumerate(cat.categories):
+                bits = np.zeros(self.n_rows, dtype=bool)
+                bits[order[bounds[i]:bounds[i + 1]]] = True
+                masks[value] = np.packbits(bits)
+            self._value_masks.setdefault(column, masks)
+        return self._value_masks[column]
+
+    def _condition_mask(self, column, condition):
+        if condition[0] == 'between':
+            return self.dataset.sorted_index(column).mask_between(condition[1], condition[2])
+        masks = self.value_masks(column)
+        if masks is None:
+            return self.dataset.df[column].isin(list(condition[1])).to_numpy(dtype=bool)
+        bits = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        for value in condition[1]:
+            bitmap = masks.get(value)
+            if bitmap is not None:
+                bits |= bitmap
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
+
+    def mask(self, spec):
+        """Boolean row mask (read-only) of rows meeting every condition of spec; all rows for an empty spec."""
+        def compute():
+            result = np.ones(self.n_rows, dtype=bool)
+            for column, condition in spec:
+                result &= self._cached(((column, condition),), lambda: self._condition_mask(column, condition))
+            return result
+        if len(spec) == 1:
+            column, condition = spec[0]
+            return self._cached(spec, lambda: self._condition_mask(column, condition))
+        return self._cached(spec, compute)
+
+    def rows(self, spec):
+        """Row positions (read-only, ascending) matching spec."""
+        return self._cached(('rows',) + spec, lambda: np.flatnonzero(self.mask(spec)))
+
+    def select(self, spec, columns=None):
+        """The matching rows of the catalog frame, limited to columns (all if None)."""
+        df = self.dataset.df
+        rows = self.rows(spec)
+        if columns is None:
+            return df.iloc[rows]
+        return df.iloc[rows, np.flatnonzero(df.columns.isin(columns))]
+
+    def count(self, spec):
+        return len(self.rows(spec))
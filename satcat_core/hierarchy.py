@@ -0,0 +1,173 @@
+import numpy as np
+import pandas as pd
+
+# Pointer-jumping rounds when resolving roots; parent chains are far shallower than 2 ** this.
+MAX_JUMPS = 32
+
+def launch_designator(piece):
+    """Launch part of international designators ('1998-067A' -> '1998-067'), missing where there is none."""
+    launch = piece.astype(str).str.slice(0, 8)
+    return launch.where(launch.str.match(r'\d{4}-\d{3}$'))
+
+class HierarchyIndex:
+    """
+    Parent/child structure of the catalog from the Parent column, by row position: parent[row] is the
+    parent's row (-1 for none or an unknown JCAT), children are CSR arrays (children of row r are
+    child_rows[child_offsets[r]:child_offsets[r + 1]]), root[row] is the top of the row's chain, depth[row]
+    its distance from there and descendants[row] the size of its subtree without itself. Launch designators are factorized once, so per-root and per-launch counts are single bincounts.
+    """
+
+    def __init__(self, df, jcat_column='#JCAT', parent_column='Parent'):
+        self.n_rows = len(df)
+        self.jcat = df[jcat_column].astype(str).str.strip().to_numpy(dtype=object)
+        # A JCAT listed twice resolves to its first row.
+        first = ~pd.Index(self.jcat).duplicated()
+        self._jcat_keys, self._jcat_rows = pd.Index(self.jcat[first]), np.flatnonzero(first)
+        # Parent is a JCAT id, possibly followed by a note; '-' (or anything unknown) means no parent.
+        parent_keys = df[parent_column].astype(str).str.replace(r'\s.*$', '', regex=True).str.strip()
+        parent = self._rows_of(parent_keys)
+        rows = np.arange(self.n_rows)
+        parent[parent == rows] = -1
+        self.parent = parent
+        self.root, self.depth = self._resolve_roots()
+        # A chain ending at a row that has a parent went round a parent cycle (a data error): cut it and resolve again.
+        if (parent[self.root] >= 0).any():
+            self.parent = parent = _drop_cycles(parent, self.root)
+            self.root, self.depth = self._resolve_roots()
+        has_parent = np.flatnonzero(parent >= 0)
+        order = has_parent[np.argsort(parent[has_parent], kind='stable')]
+        self.child_rows = order
+        self.child_offsets = np.searchsorted(parent[order], np.arange(self.n_rows + 1))
+        self.descendants = self._subtree_sizes() - 1
+        launches = launch_designator(df['Piece']) if 'Piece' in df.columns else pd.Series(np.nan, index=df.index)
+        self.launch_codes, self.launches = pd.factorize(launches, sort=True)
+        self.launches = np.asarray(self.launches, dtype=object)
+
+    def _rows_of(self, keys):
+        found = self._jcat_keys.get_indexer(keys)
+        return np.where(found >= 0, self._jcat_rows[found], -1)
+
+    def _resolve_roots(self):
+        # Pointer jumping: every round doubles the distance each pointer covers.
+        up = np.where(self.parent >= 0, self.parent, np.arange(self.n_rows))
+        depth = (self.parent >= 0).astype(np.int64)
+        for _ in range(MAX_JUMPS):
+            next_up = up[up]
+            if np.array_equal(next_up, up):
+                break
+            depth = depth + depth[up]
+            up = next_up
+        return up, depth
+
+    def _subtree_sizes(self):
+        # Deepest level first, each row adds its finished subtree size to its parent's.
+        sizes = np.ones(self.n_rows, dtype=np.int64)
+        linked = np.flatnonzero(self.depth > 0)
+        linked = linked[np.argsort(self.depth[linked], kind='stable')]
+        level_starts = np.searchsorted(self.depth[linked], np.arange(self.depth.max(initial=0) + 2))
+        for level in range(len(level_starts) - 2, 0, -1):
+            rows = linked[level_starts[level]:level_starts[level + 1]]
+            sizes += np.bincount(self.parent[rows], weights=sizes[rows], minlength=self.n_rows).astype(np.int64)
+        return sizes
+
+    def row_of(self, jcat):
+        """Row position of a JCAT id, or None."""
+        row = self._rows_of([str(jcat).strip()])[0]
+        return None if row < 0 else int(row)
+
+    def children(self, row):
+        """Row positions of the direct children of row."""
+        return self.child_rows[self.child_offsets[row]:self.child_offsets[row + 1]]
+
+    def subtree(self, row, include_self=False):
+        """Row positions (ascending) of every object descended from row, level by level over the CSR arrays."""
+        seen = np.zeros(self.n_rows, dtype=bool)
+        seen[row] = True
+        frontier = np.array([row])
+        while len(frontier):
+            starts, ends = self.child_offsets[frontier], self.child_offsets[frontier + 1]
+            sizes = ends - starts
+            if not sizes.sum():
+                break
+            positions = np.repeat(starts - np.cumsum(sizes) + sizes, sizes) + np.arange(sizes.sum())
+            frontier = self.child_rows[positions]
+            frontier = frontier[~seen[frontier]]
+            seen[frontier] = True
+        if not include_self:
+            seen[row] = False
+        return np.flatnonzero(seen)
+
+    def ancestors(self, row):
+        """Row positions from row's parent up to its root."""
+        chain = []
+        current = self.parent[row]
+        while current >= 0 and len(chain) < self.n_rows and current != row:
+            chain.append(int(current))
+            current = self.parent[current]
+        return np.array(chain, dtype=np.int64)
+
+    def fragment_counts(self, df, by='CoarseType'):
+        """
+        One row per root object with descendants: JCAT, Name, launch, the number of descendants, the
+        deepest level and descendant counts per value of by (e.g. D debris, R stages, C components).
+        """
+        rows = np.arange(self.n_rows)
+        roots = np.flatnonzero((self.descendants > 0) & (self.root == rows))
+        is_descendant = self.root != rows
+        max_depth = np.zeros(self.n_rows, dtype=np.int64)
+        np.maximum.at(max_depth, self.root, self.depth)
+        summary = pd.DataFrame({'JCAT': self.jcat[roots], 'Descendants': self.descendants[roots],
+                                'MaxDepth': max_depth[roots]})
+        if 'Name' in df.columns:
+            summary['Name'] = df['Name'].to_numpy()[roots]
+        launch_codes = self.launch_codes[roots]
+        summary['Launch'] = np.where(launch_codes >= 0, self.launches[launch_codes], None)
+        if by in df.columns:
+            counts, values = _split_counts(self.root[is_descendant], df[by].to_numpy()[is_descendant], self.n_rows)
+            for i, value in enumerate(values):
+                if counts[roots, i].any():
+                    summary[f'{by}_{value}'] = counts[roots, i]
+        summary.index = roots
+        return summary.sort_values('Descendants', ascending=False, kind='stable')
+
+    def launch_rows(self, launch):
+        """Row positions of the objects from one launch ('1998-067')."""
+        code = np.searchsorted(self.launches, launch)
+        if code == len(self.launches) or self.launches[code] != launch:
+            return np.array([], dtype=np.int64)
+        return np.flatnonzero(self.launch_codes == code)
+
+    def launch_counts(self, df, by='CoarseType'):
+        """Objects per launch (international designator without the piece letter), split by the values of by."""
+        known = self.launch_codes >= 0
+        counts = pd.DataFrame({'Launch': self.launches, 'Objects': np.bincount(self.launch_codes[known],
+                                                                             minlength=len(self.launches))})
+        if by in df.columns:
+            split, values = _split_counts(self.launch_codes[known], df[by].to_numpy()[known], len(self.launches))
+            for i, value in enumerate(values):
+                counts[f'{by}_{value}'] = split[:, i]
+        return counts.sort_values('Objects', ascending=False, kind='stable').reset_index(drop=True)
+
+def _drop_cycles(parent, up):
+    """parent without the links of rows on a parent cycle, given each row's pointer-jumped ancestor up."""
+    # Rows whose chain never reaches a parentless row are on a cycle or hang below one.
+    on_cycle = parent[up] >= 0
+    # Peel off the rows below a cycle (no stuck row points at them) until only the cycles are left.
+    while True:
+        pointed = np.zeros(len(parent), dtype=bool)
+        pointed[parent[on_cycle]] = True
+        below = on_cycle & ~pointed
+        if not below.any():
+            break
+        on_cycle &= ~below
+    parent = parent.copy()
+    parent[on_cycle] = -1
+    return parent
+
+def _split_counts(groups, values, n_groups):
+    """(n_groups x n_values count matrix, values) of the non-missing values per group."""
+    codes, labels = pd.factorize(values, sort=True)
+    keep = codes >= 0
+    n_values = max(len(labels), 1)
+    counts = np.bincount(groups[keep] * n_values + codes[keep], minlength=n_groups * n_values)
+    return counts.reshape(n_groups, n_values), labels
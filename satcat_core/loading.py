@@ -0,0 +1,36 @@
+import logging
+import os
+import time
+
+from constants import CACHE_DIR, PARSE_WORKERS
+from satcat_core.cache import load_cached_satcat, save_cached_satcat
+from satcat_core.parsing import get_satcat_update_date, parse_satcat_html
+from satcat_core.perf import timed
+
+logger = logging.getLogger(__name__)
+
+def load_catalog(data_file, use_cache=True, workers=PARSE_WORKERS, cache_dir=CACHE_DIR):
+    """
+    Loads the SATCAT data file and returns (DataFrame, update_date_str).
+    A matching columnar cache is loaded directly; otherwise the file is parsed and the cache rewritten.
+    Raises FileNotFoundError if data_file is missing and ValueError if it cannot be parsed or holds no rows.
+    """
+    if not os.path.exists(data_file):
+        raise FileNotFoundError(f"SATCAT file '{data_file}' not found.")
+    if use_cache:
+        with timed('cache:load') as span:
+            df, update_date = load_cached_satcat(data_file, cache_dir)
+            span.set(rows=None if df is None else len(df), hit=df is not None)
+        if df is not None:
+            logger.info("Loaded %d rows of %s from cache", len(df), data_file)
+            return df, update_date
+    start = time.perf_counter()
+    df = parse_satcat_html(data_file, workers=workers)
+    if df.empty:
+        raise ValueError(f"No catalog rows found in '{data_file}'.")
+    update_date = get_satcat_update_date(data_file)
+    logger.info("Parsed %d rows of %s in %.2f s", len(df), data_file, time.perf_counter() - start)
+    if use_cache:
+        with timed('cache:save', len(df)):
+            save_cached_satcat(data_file, df, update_date, cache_dir)
+    return df, update_date
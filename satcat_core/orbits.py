@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+
+EARTH_RADIUS_KM = 6378.137
+EARTH_MU_KM3_S2 = 398600.4418
+LEO_MAX_ALTITUDE_KM = 2000
+GEO_ALTITUDE_KM = 35786
+# Perigee and apogee both within this distance of the geostationary altitude count as GEO.
+GEO_BAND_KM = 200
+HEO_MIN_ECCENTRICITY = 0.25
+ORBIT_REGIMES = ['LEO', 'MEO', 'GEO', 'HEO']
+
+def orbit_elements(perigee, apogee):
+    """(semi-major axis km, eccentricity, period minutes) from perigee/apogee altitudes in km, NaN where missing."""
+    perigee = np.asarray(perigee, dtype='float64')
+    apogee = np.asarray(apogee, dtype='float64')
+    r_perigee, r_apogee = perigee + EARTH_RADIUS_KM, apogee + EARTH_RADIUS_KM
+    semi_major = (r_perigee + r_apogee) / 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        eccentricity = np.abs(r_apogee - r_perigee) / (r_apogee + r_perigee)
+        period = np.where(semi_major > 0, 2 * np.pi * np.sqrt(semi_major ** 3 / EARTH_MU_KM3_S2) / 60, np.nan)
+    return semi_major, eccentricity, period
+
+def orbit_regime(perigee, apogee, eccentricity):
+    """
+    LEO (apogee below 2000 km), GEO (perigee and apogee within GEO_BAND_KM of 35786 km), HEO (eccentricity
+    of 0.25 or more, or apogee above the GEO band) and MEO for the rest, as a categorical; missing without orbit data.
+    """
+    perigee = np.asarray(perigee, dtype='float64')
+    apogee = np.asarray(apogee, dtype='float64')
+    known = ~(np.isnan(perigee) | np.isnan(apogee))
+    geo = (np.abs(perigee - GEO_ALTITUDE_KM) <= GEO_BAND_KM) & (np.abs(apogee - GEO_ALTITUDE_KM) <= GEO_BAND_KM)
+    leo = apogee < LEO_MAX_ALTITUDE_KM
+    heo = (eccentricity >= HEO_MIN_ECCENTRICITY) | (apogee > GEO_ALTITUDE_KM + GEO_BAND_KM)
+    codes = np.select([~known, geo, leo, heo], [-1, 2, 0, 3], default=1)
+    return pd.Categorical.from_codes(codes, categories=ORBIT_REGIMES)
+
+def derive_orbit_columns(df):
+    """Adds SemiMajorAxis (km), Eccentricity, Period (minutes) and OrbitRegime from Perigee/Apogee in place."""
+    if 'Perigee' not in df.columns or 'Apogee' not in df.columns:
+        return df
+    perigee = df['Perigee'].to_numpy(dtype='float64', na_value=np.nan)
+    apogee = df['Apogee'].to_numpy(dtype='float64', na_value=np.nan)
+    df['SemiMajorAxis'], df['Eccentricity'], df['Period'] = orbit_elements(perigee, apogee)
+    df['OrbitRegime'] = orbit_regime(perigee, apogee, df['Eccentricity'].to_numpy())
+    return df
+
+class AltitudeIndex:
+    """
+    Index of each object's altitude interval [perigee, apogee] for overlap ("which objects pass through
+    X-Y km") queries. Intervals are grouped by length into powers of two and sorted by perigee within a
+    group, so an object overlapping [low, high] must have its perigee in (low - 2 * group length, high]:
+    one searchsorted range per group instead of a pass over the catalog.
+    """
+
+    def __init__(self, perigee, apogee, inclination=None):
+        perigee = np.asarray(perigee, dtype='float64')
+        apogee = np.asarray(apogee, dtype='float64')
+        self.n_rows = len(perigee)
+        self.inclination = None if inclination is None else np.asarray(inclination, dtype='float64')
+        rows = np.flatnonzero(~(np.isnan(perigee) | np.isnan(apogee)))
+        low, high = np.minimum(perigee[rows], apogee[rows]), np.maximum(perigee[rows], apogee[rows])
+        length_class = np.floor(np.log2(high - low + 1)).astype(np.int64)
+        self.groups = []
+        for k in np.unique(length_class):
+            members = np.flatnonzero(length_class == k)
+            members = members[np.argsort(low[members], kind='stable')]
+            self.groups.append((2.0 ** (k + 1), low[members], high[members], rows[members]))
+        # Sorted interval ends for band counts.
+        self.sorted_low = np.sort(low)
+        self.sorted_high = np.sort(high)
+
+    def __len__(self):
+        return len(self.sorted_low)
+
+    def overlapping(self, low, high, inclination=None, tolerance=None):
+        """
+        Row positions (ascending) of objects whose [perigee, apogee] overlaps [low, high] km, and if inclination
+        is given, whose inclination is within tolerance degrees of it.
+        """
+        found = []
+        for max_length, starts, ends, rows in self.groups:
+            begin = np.searchsorted(starts, low - max_length, side='right')
+            end = np.searchsorted(starts, high, side='right')
+            candidates = slice(begin, end)
+            found.append(rows[candidates][ends[candidates] >= low])
+        result = np.sort(np.concatenate(found)) if found else np.array([], dtype=np.int64)
+        if inclination is not None and self.inclination is not None:
+            result = result[np.abs(self.inclination[result] - inclination) <= (tolerance or 0)]
+        return result
+
+    def band_counts(self, edges):
+        """Objects whose altitude interval overlaps each band [edges[i], edges[i + 1]]."""
+        edges = np.asarray(edges, dtype='float64')
+        starts_below_top = np.searchsorted(self.sorted_low, edges[1:], side='right')
+        ends_below_bottom = np.searchsorted(self.sorted_high, edges[:-1], side='left')
+        return starts_below_top - ends_below_bottom
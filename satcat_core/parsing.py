@@ -0,0 +1,390 @@
+import io
+import os
+import re
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+
+from satcat_core.classify import classify_date_confidence
+from satcat_core.orbits import derive_orbit_columns
+from satcat_core.perf import timed
+from satcat_core.vague_dates import VAGUE_DATE_COLUMNS, parse_vague_dates
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# Data lines sliced per batch by the streaming parser.
+PARSE_CHUNK_ROWS = 10000
+
+# Compact storage schema applied after the derived columns are added. Low-cardinality code columns become
+# categoricals, orbit measurements float32, and every other text column an Arrow-backed string. Mass stays
+# float64: it is summed into totals, where float32 rounding of values like 12.3 would show.
+CATEGORY_COLUMNS = (
+    ['CoarseType'] + [f'SatType_{i+1}' for i in range(12)] + ['SatType_1_2', 'DateConfidence',
+    'Status', 'Dest', 'Owner', 'State', 'Manufacturer', 'Bus', 'Motor', 'Shape', 'OpOrbitOQU',
+    'MassFlag', 'DryFlag', 'TotFlag', 'LFlag', 'DFlag', 'SpanFlag', 'PF', 'AF', 'IF', 'OrbitRegime']
+)
+FLOAT32_COLUMNS = ['Perigee', 'Apogee', 'Inc', 'SemiMajorAxis', 'Eccentricity', 'Period']
+INT16_COLUMNS = ['LaunchYear']
+
+def get_satcat_update_date(filepath):
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('# Updated'):
+                    m = re.search(r'# Updated (\d{4} [A-Za-z]{3}\s+\d{1,2})', line)
+                    if m:
+                        return m.group(1).strip()
+    except Exception:
+        pass
+    return None
+
+def get_satcat_update_date_from_content(content):
+    for line in content.splitlines():
+        if line.startswith('# Updated'):
+            m = re.search(r'# Updated (\d{4} [A-Za-z]{3}\s+\d{1,2})', line)
+            if m:
+                return m.group(1).strip()
+    return None
+
+# A data row is an 'S' record id (after optional indentation); '#' comments and blanks never match.
+_DATA_LINE_RE = re.compile(r'\s*S\d')
+
+def _slice_fixed_width_rows(data_lines, header_positions, n_columns):
+    """Reference row-by-row slicer, kept for benchmarking the vectorized engine."""
+    data_rows = []
+    for line in data_lines:
+        row = []
+        for i in range(n_columns):
+            start = header_positions[i]
+            end = header_positions[i+1] if i+1 < len(header_positions) else len(line)+1
+            if start < len(line):
+                if end <= len(line):
+                    field = line[start:end].strip()
+                else:
+                    field = line[start:].strip()
+            else:
+                field = ""
+            row.append(field)
+        data_rows.append(row)
+    return data_rows
+
+def _slice_fixed_width_columns(data_lines, header_positions, n_columns):
+    """
+    Cuts every column out of the data lines at once and returns one stripped object array per column.
+    The lines are packed into a NUL-padded UCS4 buffer so that a column is a plain 2-D slice of code points;
+    NUL padding past the end of a short line reads back as an empty string, like the row slicer.
+    """
+    n_rows = len(data_lines)
+    width = max((len(line) for line in data_lines), default=0)
+    if n_rows == 0 or width == 0:
+        return [np.full(n_rows, '', dtype=object) for _ in range(n_columns)]
+    buf = np.array(data_lines, dtype=f'U{width}').view(np.uint32).reshape(n_rows, width)
+    columns = []
+    for i in range(n_columns):
+        start = header_positions[i]
+        end = min(header_positions[i+1], width)
+        if start >= end:
+            columns.append(np.full(n_rows, '', dtype=object))
+            continue
+        field = np.ascontiguousarray(buf[:, start:end]).view(f'U{end - start}').ravel()
+        columns.append(np.char.strip(field).astype(object))
+    return columns
+
+def _header_columns(header_text):
+    header_positions = []
+    column_names = []
+    for match in re.finditer(r'\S+', header_text):
+        header_positions.append(match.start())
+        column_names.append(match.group())
+    header_positions.append(len(header_text) + 1)
+    return header_positions, column_names
+
+def _iter_pre_blocks(lines):
+    """
+    Yields (block_number, text) for every line of every <PRE>...</PRE> block, without the newline.
+    Equivalent to splitting each re.findall(r'<PRE>(.*?)</PRE>', content, re.DOTALL) match on '\n',
+    but only ever holds one line of the file.
+    """
+    block = -1
+    inside = False
+    for line in lines:
+        line = line.rstrip('\n')
+        pos = 0
+        while True:
+            if not inside:
+                tag = line.find('<PRE>', pos)
+                if tag < 0:
+                    break
+                block += 1
+                inside = True
+                pos = tag + len('<PRE>')
+            else:
+                tag = line.find('</PRE>', pos)
+                if tag < 0:
+                    yield block, line[pos:]
+                    break
+                yield block, line[pos:tag]
+                inside = False
+                pos = tag + len('</PRE>')
+
+def _stream_satcat_sections(lines):
+    """
+    Returns (header_text, data_lines) for an iterable of file lines. data_lines lazily yields the lines of
+    the first non-blank <PRE> block after the header, stripped at the block edges like the whole-file parser.
+    Raises ValueError if the header or data block is missing.
+    """
+    pieces = _iter_pre_blocks(lines)
+    header_parts = []
+    n_blocks = 0
+    data_block = None
+    for block, text in pieces:
+        n_blocks = block + 1
+        if block == 0:
+            header_parts.append(text)
+        elif text.strip():
+            data_block, first_line = block, text.lstrip()
+            break
+    if data_block is None:
+        if n_blocks < 2:
+            raise ValueError("Could not find at least two PRE tags in the HTML file.")
+        raise ValueError("No data found in PRE tags after header.")
+
+    def data_lines():
+        yield first_line
+        for block, text in pieces:
+            if block != data_block:
+                return
+            yield text
+
+    return '\n'.join(header_parts).strip(), data_lines()
+
+def _parse_data_lines_chunked(data_lines, header_positions, column_names, chunk_rows):
+    """
+    Slices matching data lines chunk_rows at a time and concatenates each column once at the end,
+    so only one chunk of raw lines and one column of temporaries are alive beyond the final frame.
+    """
+    chunks = [[] for _ in column_names]
+
+    def flush(batch):
+        for parts, values in zip(chunks, _slice_fixed_width_columns(batch, header_positions, len(column_names))):
+            parts.append(pd.Series(values))
+
+    batch = []
+    for line in data_lines:
+        if _DATA_LINE_RE.match(line):
+            batch.append(line)
+            if len(batch) >= chunk_rows:
+                flush(batch)
+                batch = []
+    if batch or not chunks[0]:
+        flush(batch)
+    columns = {}
+    for i in range(len(column_names)):
+        parts, chunks[i] = chunks[i], None
+        columns[i] = parts[0] if len(parts) == 1 else pd.concat(parts, ignore_index=True)
+    df = pd.DataFrame(columns, copy=False)
+    df.columns = column_names
+    return df
+
+def _parse_satcat_html_python(html_file):
+    """Reference whole-file parser with the row-by-row slicer, kept for benchmarking."""
+    with open(html_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    pre_matches = re.findall(r'<PRE>(.*?)</PRE>', content, re.DOTALL)
+    if len(pre_matches) < 2:
+        raise ValueError("Could not find at least two PRE tags in the HTML file.")
+    header_text = pre_matches[0].strip()
+    for m in pre_matches[1:]:
+        data_text = m.strip()
+        if data_text:
+            break
+    else:
+        raise ValueError("No data found in PRE tags after header.")
+    header_positions, column_names = _header_columns(header_text)
+    data_lines = [line for line in data_text.split('\n') if _DATA_LINE_RE.match(line)]
+    return pd.DataFrame(_slice_fixed_width_rows(data_lines, header_positions, len(column_names)), columns=column_names)
+
+def _locate_data_section(f):
+    """
+    Scans a binary file object for the header text and the byte range [start, end) of the data block,
+    using the same block rules as _stream_satcat_sections. start is the first non-blank character of the block.
+    """
+    header_parts = []
+    block = -1
+    inside = False
+    offset = 0
+    data_block = data_start = None
+    for raw in f:
+        pos = 0
+        while True:
+            if not inside:
+                tag = raw.find(b'<PRE>', pos)
+                if tag < 0:
+                    break
+                block += 1
+                inside = True
+                pos = tag + len('<PRE>')
+                continue
+            tag = raw.find(b'</PRE>', pos)
+            piece = raw[pos:tag if tag >= 0 else len(raw)]
+            if block == 0:
+                header_parts.append(piece)
+            elif data_start is None:
+                text = piece.decode('utf-8')
+                if text.strip():
+                    lead = text[:len(text) - len(text.lstrip())]
+                    data_block, data_start = block, offset + pos + len(lead.encode('utf-8'))
+            if tag < 0:
+                break
+            if block == data_block:
+                return _decode_lines(b''.join(header_parts)).strip(), data_start, offset + tag
+            inside = False
+            pos = tag + len('</PRE>')
+        offset += len(raw)
+    if data_start is None:
+        if block < 1:
+            raise ValueError("Could not find at least two PRE tags in the HTML file.")
+        raise ValueError("No data found in PRE tags after header.")
+    return _decode_lines(b''.join(header_parts)).strip(), data_start, offset
+
+def _decode_lines(raw):
+    # Same newline translation as reading the file in text mode.
+    return io.StringIO(raw.decode('utf-8'), newline=None).read()
+
+def _split_line_aligned(f, start, end, n_parts):
+    """Splits [start, end) into up to n_parts byte ranges that each begin at the start of a line."""
+    bounds = [start]
+    for i in range(1, n_parts):
+        f.seek(start + (end - start) * i // n_parts)
+        f.readline()
+        bound = min(f.tell(), end)
+        if bound > bounds[-1]:
+            bounds.append(bound)
+    if end > bounds[-1]:
+        bounds.append(end)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+def _parse_byte_range(html_file, start, end, header_positions, column_names, chunk_rows):
+    """Worker for the parallel engine: parses the data lines in one line-aligned byte range."""
+    with open(html_file, 'rb') as f:
+        f.seek(start)
+        text = _decode_lines(f.read(end - start))
+    return _parse_data_lines_chunked(text.split('\n'), header_positions, column_names, chunk_rows)
+
+def _parse_satcat_html_parallel(html_file, workers, chunk_rows):
+    with open(html_file, 'rb') as f:
+        header_text, start, end = _locate_data_section(f)
+        ranges = _split_line_aligned(f, start, end, workers)
+    header_positions, column_names = _header_columns(header_text)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_parse_byte_range, html_file, range_start, range_end, header_positions, column_names, chunk_rows)
+                   for range_start, range_end in ranges]
+        frames = [future.result() for future in futures]
+    non_empty = [frame for frame in frames if len(frame)]
+    if len(non_empty) == 1:
+        return non_empty[0]
+    if not non_empty:
+        return _parse_data_lines_chunked([], header_positions, column_names, chunk_rows)
+    return pd.concat(non_empty, ignore_index=True)
+
+def slice_satcat_html(html_file, chunk_rows=PARSE_CHUNK_ROWS):
+    """
+    The slicing stage of parse_satcat_html on its own: streams html_file line by line and returns its data rows
+    as a DataFrame of raw strings, one column per header name, before derive_satcat_columns and
+    apply_compact_schema. Raises ValueError if the file does not have the expected header and data blocks.
+    """
+    with open(html_file, 'r', encoding='utf-8') as f:
+        header_text, data_lines = _stream_satcat_sections(f)
+        header_positions, column_names = _header_columns(header_text)
+        return _parse_data_lines_chunked(data_lines, header_positions, column_names, chunk_rows)
+
+def parse_satcat_html(html_file, engine='numpy', chunk_rows=PARSE_CHUNK_ROWS, workers=1):
+    """
+    Parses the SATCAT HTML file into a DataFrame with derived columns.
+    engine='numpy' streams the file line by line and slices columns in chunks of chunk_rows;
+    with workers > 1 (None for one per CPU) the data block is instead split into line-aligned byte
+    ranges parsed in a process pool and concatenated in file order.
+    engine='python' is the original whole-file, row-by-row parser.
+    Raises ValueError if the file does not have the expected header and data blocks.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    with timed('parse:slice', engine=engine, workers=workers) as span:
+        if engine == 'python':
+            df = _parse_satcat_html_python(html_file)
+        elif workers > 1:
+            df = _parse_satcat_html_parallel(html_file, workers, chunk_rows)
+        else:
+            df = slice_satcat_html(html_file, chunk_rows)
+        span.set(rows=len(df))
+    with timed('parse:derive', len(df)):
+        df = derive_satcat_columns(df)
+    with timed('parse:compact_schema', len(df)):
+        return apply_compact_schema(df)
+
+def derive_satcat_columns(df):
+    """
+    Adds the derived SatType, LaunchYear, DateConfidence, parsed date (<col>_DT, <col>_Prec) and orbit
+    (SemiMajorAxis, Eccentricity, Period, OrbitRegime) columns and converts the numeric columns in place.
+    """
+    if 'Type' in df.columns:
+        sat_type = df['Type'].astype(str)
+        df['CoarseType'] = sat_type.str[0]
+        for i in range(12):
+            df[f'SatType_{i+1}'] = sat_type.str[i].replace({'': '-', ' ': '-'})
+        df['SatType_1_2'] = sat_type.str[:2]
+    if 'LDate' in df.columns:
+        df['LaunchYear'] = df['LDate'].astype(str).str.extract(r'(\d{4})').astype(float)
+    for col in ['Mass', 'Perigee', 'Apogee', 'Inc']:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce')
+    derive_orbit_columns(df)
+    if 'LDate' in df.columns:
+        df['DateConfidence'] = classify_date_confidence(df['LDate'])
+    for col in VAGUE_DATE_COLUMNS:
+        if col in df.columns:
+            df[f'{col}_DT'], df[f'{col}_Prec'] = parse_vague_dates(df[col])
+    return df
+
+def _arrow_string_dtype():
+    if pyarrow is None:
+        return None
+    try:
+        # NaN-missing flavour (the pandas 3 default 'str'), so comparisons still give plain bool masks.
+        return pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:
+        return pd.StringDtype('pyarrow')
+
+def apply_compact_schema(df):
+    """Converts the parsed and derived columns to the compact storage dtypes in place."""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in FLOAT32_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('float32')
+    for col in INT16_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('Int16')
+    string_dtype = _arrow_string_dtype()
+    if string_dtype is not None:
+        for i, dtype in enumerate(df.dtypes):
+            if dtype != string_dtype and (pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.StringDtype)):
+                df.isetitem(i, df.iloc[:, i].astype(string_dtype))
+    return df
+
+def memory_report(before, after):
+    """Per-column dtype and deep memory usage (MiB) of two versions of the same frame, with a total row."""
+    rows = []
+    for col in after.columns:
+        before_bytes = before[col].memory_usage(deep=True, index=False) if col in before.columns else 0
+        rows.append((col, str(before[col].dtype) if col in before.columns else '', str(after[col].dtype),
+                     before_bytes, after[col].memory_usage(deep=True, index=False)))
+    report = pd.DataFrame(rows, columns=['Column', 'DtypeBefore', 'DtypeAfter', 'MiBBefore', 'MiBAfter'])
+    report.loc[len(report)] = ['(total)', '', '', report['MiBBefore'].sum(), report['MiBAfter'].sum()]
+    report[['MiBBefore', 'MiBAfter']] = report[['MiBBefore', 'MiBAfter']] / 2**20
+    report['Ratio'] = report['MiBBefore'] / report['MiBAfter']
+    return report
@@ -0,0 +1,116 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+from constants import PERF_ENABLED, PERF_LOG_FILE
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Timing records kept in memory for the diagnostics panel, newest last.
+MAX_RECORDS = 2000
+
+_records = deque(maxlen=MAX_RECORDS)
+_lock = threading.Lock()
+_PAGE_MB = (os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096) / 2**20
+
+def _rss_mb():
+    """Current resident memory of the process (peak memory where /proc is unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_MB
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 if resource else 0.0
+
+class _Span:
+    """One timed block: wall time, rows processed and resident memory delta, recorded on exit."""
+
+    active = True
+
+    def __init__(self, name, rows, fields):
+        self.record = {'name': name, 'rows': rows, **fields}
+
+    def set(self, **fields):
+        self.record.update(fields)
+
+    def __enter__(self):
+        self._rss = _rss_mb()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        record = self.record
+        record['wall_ms'] = (time.perf_counter() - self._start) * 1e3
+        record['rss_delta_mb'] = _rss_mb() - self._rss
+        record['thread'] = threading.get_ident()
+        record['ts'] = time.time()
+        if exc_type is not None:
+            record['error'] = exc_type.__name__
+        _emit(record)
+        return False
+
+class _NullSpan:
+    """What timed returns while instrumentation is off: entering, exiting and set do nothing."""
+
+    active = False
+
+    def set(self, **fields):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+def _emit(record):
+    with _lock:
+        _records.append(record)
+        if PERF_LOG_FILE:
+            try:
+                with open(PERF_LOG_FILE, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(record, default=str) + '\n')
+            except OSError as e:
+                logger.warning("Could not write timing record to %s: %s", PERF_LOG_FILE, e)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(record, default=str))
+
+def timed(name, rows=None, **fields):
+    """
+    Context manager timing the block as name; `with timed('parse') as span: ...; span.set(rows=n)`.
+    Returns a shared no-op span when SATEXPLORER_PERF is off.
+    """
+    if not PERF_ENABLED:
+        return _NULL_SPAN
+    return _Span(name, rows, fields)
+
+def instrumented(name=None):
+    """Decorator timing every call; rows is the length of the first argument if it has one. Off = undecorated."""
+    def decorate(func):
+        if not PERF_ENABLED:
+            return func
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            rows = len(args[0]) if args and hasattr(args[0], '__len__') else None
+            with timed(label, rows):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def recent_records(since=None, thread=None):
+    """Recorded timings, oldest first, optionally only those finished after since (epoch seconds) on thread."""
+    with _lock:
+        records = list(_records)
+    return [r for r in records if (since is None or r['ts'] >= since) and (thread is None or r['thread'] == thread)]
@@ -0,0 +1,58 @@
+import numpy as np
+
+N_BYTES = 12
+_MISSING = 0
+_SPACE, _DASH = ord(' '), ord('-')
+
+class SatTypeIndex:
+    """
+    The 12-byte SatType code of every row as an N x 12 uint8 matrix, plus one packed bitmap per (byte, value).
+    Byte values follow the SatType_N columns: a blank byte reads as '-', and a byte past the end of a short
+    code is missing and never matches a filter. Selections resolve with bitwise OR within a byte and AND
+    across bytes, and the values still available under a selection are read from the bitmaps, not the rows.
+    """
+
+    def __init__(self, type_series):
+        codes = type_series.astype(str).to_numpy(dtype=f'U{N_BYTES}')
+        self.n_rows = len(codes)
+        self.matrix = codes.view(np.uint32).reshape(self.n_rows, N_BYTES).astype(np.uint8)
+        self.matrix[self.matrix == _SPACE] = _DASH
+        self._bitmaps = []
+        for byte in range(N_BYTES):
+            column = self.matrix[:, byte]
+            values, first_rows = np.unique(column, return_index=True)
+            present = values[np.argsort(first_rows)]
+            self._bitmaps.append({chr(v): np.packbits(column == v) for v in present if v != _MISSING})
+
+    def values(self, byte):
+        """All values seen at byte (0-based), in order of first appearance."""
+        return list(self._bitmaps[byte])
+
+    def all_rows(self):
+        return np.packbits(np.ones(self.n_rows, dtype=bool))
+
+    def any_of(self, byte, values):
+        """Packed bitmap of the rows whose byte is one of values."""
+        bits = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        for value in values:
+            bitmap = self._bitmaps[byte].get(value)
+            if bitmap is not None:
+                bits |= bitmap
+        return bits
+
+    def select(self, selections, bits=None):
+        """Packed bitmap of the rows matching every {byte: values} selection, optionally within bits."""
+        bits = self.all_rows() if bits is None else bits.copy()
+        for byte, values in selections.items():
+            bits &= self.any_of(byte, values)
+        return bits
+
+    def available_values(self, byte, bits):
+        """Values at byte that occur in at least one row of bits, in order of first appearance."""
+        return [value for value, bitmap in self._bitmaps[byte].items() if np.bitwise_and(bitmap, bits).any()]
+
+    def count(self, bits):
+        return int(np.unpackbits(bits, count=self.n_rows).sum())
+
+    def to_mask(self, bits):
+        return np.unpackbits(bits, count=self.n_rows).astype(bool)
@@ -0,0 +1,116 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# Identifier columns matched by key prefix: JCAT ('S25544'), catalog number, international designator.
+KEY_COLUMNS = ['#JCAT', 'Satcat', 'Piece']
+# Free-text columns matched word by word.
+TEXT_COLUMNS = ['Name', 'PLName', 'Owner', 'AltNames']
+
+_TOKEN_RE = re.compile(r'\w+')
+_MAX_CHAR = '\U0010ffff'
+
+def _prefix_range(keys, prefix):
+    """(lo, hi) of the sorted unicode array keys starting with prefix."""
+    # Needles are cast to the array's width; a longer needle would make searchsorted copy the whole array.
+    width = keys.dtype.itemsize // 4
+    if len(prefix) > width:
+        return 0, 0
+    lo = np.searchsorted(keys, np.array(prefix, dtype=keys.dtype), side='left')
+    if len(prefix) == width:
+        return lo, np.searchsorted(keys, np.array(prefix, dtype=keys.dtype), side='right')
+    return lo, np.searchsorted(keys, np.array(prefix + _MAX_CHAR, dtype=keys.dtype), side='left')
+
+def tokenize(text):
+    """Upper-cased word tokens of text, as indexed and as matched."""
+    return _TOKEN_RE.findall(str(text).upper())
+
+class _KeyIndex:
+    """Sorted, upper-cased keys of one column with their row positions; a prefix is one searchsorted range."""
+
+    def __init__(self, series):
+        keys = series.astype(str).str.strip().str.upper().to_numpy(dtype=str)
+        self.order = np.argsort(keys, kind='stable')
+        self.keys = keys[self.order]
+
+    def prefix(self, prefix):
+        lo, hi = _prefix_range(self.keys, prefix)
+        return self.order[lo:hi]
+
+    def exact(self, key):
+        if len(key) > self.keys.dtype.itemsize // 4:
+            return self.order[:0]
+        key = np.array(key, dtype=self.keys.dtype)
+        lo, hi = np.searchsorted(self.keys, key, side='left'), np.searchsorted(self.keys, key, side='right')
+        return self.order[lo:hi]
+
+class _TokenIndex:
+    """
+    Inverted index from every word of the text columns to the rows containing it. The vocabulary is sorted,
+    so all words starting with a prefix form one contiguous run whose posting lists are adjacent too.
+    """
+
+    def __init__(self, df, columns):
+        text = pd.Series('', index=range(len(df)), dtype=object)
+        for column in columns:
+            text = text + ' ' + df[column].astype(object).fillna('').astype(str).to_numpy()
+        tokens = text.str.upper().str.findall(_TOKEN_RE.pattern).explode().dropna()
+        pairs = pd.DataFrame({'row': tokens.index.to_numpy(dtype=np.int64), 'token': tokens.to_numpy(dtype=object)})
+        pairs = pairs.drop_duplicates()
+        token_ids, vocabulary = pd.factorize(pairs['token'], sort=True)
+        rows = pairs['row'].to_numpy()
+        order = np.lexsort((rows, token_ids))
+        self.vocabulary = np.asarray(vocabulary, dtype=str)
+        self.postings = rows[order]
+        self.offsets = np.searchsorted(token_ids[order], np.arange(len(self.vocabulary) + 1))
+
+    def prefix(self, prefix):
+        """Rows (ascending) with a word starting with prefix."""
+        lo, hi = _prefix_range(self.vocabulary, prefix)
+        if hi - lo == 1:
+            return self.postings[self.offsets[lo]:self.offsets[hi]]
+        return np.unique(self.postings[self.offsets[lo]:self.offsets[hi]])
+
+class SearchIndex:
+    """
+    Search over a catalog frame, built once per dataset. A query matches rows whose JCAT, catalog number
+    or designator starts with it, and rows where every word of the query starts a word of the name, payload
+    name, owner or alternative names. Matching is case-insensitive.
+    """
+
+    def __init__(self, df, key_columns=KEY_COLUMNS, text_columns=TEXT_COLUMNS):
+        self.n_rows = len(df)
+        self.keys = {column: _KeyIndex(df[column]) for column in key_columns if column in df.columns}
+        text_columns = [column for column in text_columns if column in df.columns]
+        self.tokens = _TokenIndex(df, text_columns) if text_columns else None
+
+    def search(self, query, limit=None):
+        """
+        Row positions matching query: exact identifier matches first, then identifier prefixes, then word
+        matches, each in catalog order; at most limit rows. An empty query matches nothing.
+        """
+        query = query.strip().upper()
+        if not query:
+            return np.array([], dtype=np.int64)
+        exact = [index.exact(query) for index in self.keys.values()]
+        prefix = [index.prefix(query) for index in self.keys.values()]
+        words = tokenize(query)
+        word_rows = None
+        if self.tokens is not None and words:
+            for word in words:
+                rows = self.tokens.prefix(word)
+                word_rows = rows if word_rows is None else np.intersect1d(word_rows, rows, assume_unique=True)
+                if len(word_rows) == 0:
+                    break
+        groups = [np.unique(np.concatenate(exact)) if exact else np.array([], dtype=np.int64),
+                  np.unique(np.concatenate(prefix)) if prefix else np.array([], dtype=np.int64),
+                  word_rows if word_rows is not None else np.array([], dtype=np.int64)]
+        seen = np.zeros(self.n_rows, dtype=bool)
+        result = []
+        for rows in groups:
+            rows = rows[~seen[rows]]
+            seen[rows] = True
+            result.append(rows)
+        result = np.concatenate(result).astype(np.int64)
+        return result if limit is None else result[:limit]
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+class SortedIndex:
+    """
+    Row positions of a numeric or datetime64 column sorted by value, for binary-search range lookups.
+    Missing values are left out, so they never fall inside a range.
+    """
+
+    def __init__(self, values):
+        self.n_rows = len(values)
+        self.is_datetime = pd.api.types.is_datetime64_any_dtype(values.dtype)
+        if self.is_datetime:
+            stamps = values.to_numpy(dtype='datetime64[ns]')
+            keys, present = stamps.view(np.int64), ~np.isnat(stamps)
+        else:
+            keys = values.to_numpy(dtype='float64', na_value=np.nan)
+            present = ~np.isnan(keys)
+        rows = np.flatnonzero(present)
+        order = np.argsort(keys[rows], kind='stable')
+        self.rows = rows[order]
+        self.keys = keys[rows][order]
+
+    def _key(self, value):
+        return pd.Timestamp(value).value if self.is_datetime else float(value)
+
+    def _bounds(self, low, high):
+        lo = 0 if low is None else np.searchsorted(self.keys, self._key(low), side='left')
+        hi = len(self.keys) if high is None else np.searchsorted(self.keys, self._key(high), side='right')
+        return lo, max(lo, hi)
+
+    def between(self, low=None, high=None):
+        """Row positions with low <= value <= high, in value order; a None bound is open."""
+        lo, hi = self._bounds(low, high)
+        return self.rows[lo:hi]
+
+    def count_between(self, low=None, high=None):
+        lo, hi = self._bounds(low, high)
+        return int(hi - lo)
+
+    def mask_between(self, low=None, high=None):
+        """Boolean row mask of between(low, high)."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.between(low, high)] = True
+        return mask
+
+    def min(self):
+        return self.keys[0] if len(self.keys) else None
+
+    def max(self):
+        return self.keys[-1] if len(self.keys) else None
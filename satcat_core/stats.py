@@ -0,0 +1,211 @@
+import numpy as np
+import pandas as pd
+
+# Columns whose partial statistics are kept per partition, so year/type filters merge partials.
+PARTITION_DIMENSIONS = ['LaunchYear', 'CoarseType']
+# Quantile sketch: per-partition counts over at most this many global equal-depth bins
+# (exact values when a column has no more distinct values than that).
+SKETCH_BINS = 256
+# Text columns with more distinct values keep only TOP_K value counts and a HyperLogLog per partition.
+MAX_EXACT_VALUES = 4096
+TOP_K = 16
+HLL_BITS = 10
+QUANTILES = [0.25, 0.5, 0.75]
+
+NUMERIC_STATS = ['count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+DATE_STATS = ['count', 'mean', 'min', '25%', '50%', '75%', 'max']
+TEXT_STATS = ['count', 'unique', 'top', 'freq', 'approx']
+
+def _group_sum(values, groups, n_groups):
+    return np.bincount(groups, weights=values, minlength=n_groups)
+
+def _group_reduce(ufunc, values, groups, n_groups, initial):
+    out = np.full(n_groups, initial, dtype='float64')
+    ufunc.at(out, groups, values)
+    return out
+
+class _NumericPartials:
+    """count, mean, M2 (for the variance), min, max and sketch bin counts of one column, per partition."""
+
+    def __init__(self, values, partitions, n_partitions):
+        present = ~np.isnan(values)
+        values, groups = values[present], partitions[present]
+        self.count = np.bincount(groups, minlength=n_partitions)
+        total = _group_sum(values, groups, n_partitions)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.mean = total / self.count
+        self.m2 = _group_sum((values - self.mean[groups]) ** 2, groups, n_partitions)
+        self.min = _group_reduce(np.minimum, values, groups, n_partitions, np.inf)
+        self.max = _group_reduce(np.maximum, values, groups, n_partitions, -np.inf)
+        distinct = np.unique(values)
+        # Exact value counts for low-cardinality columns, equal-depth bins otherwise.
+        self.exact = len(distinct) <= SKETCH_BINS
+        self.edges = distinct if self.exact else np.unique(np.quantile(values, np.linspace(0, 1, SKETCH_BINS + 1)))
+        n_bins = len(self.edges)
+        bins = np.searchsorted(self.edges, values, side='right' if not self.exact else 'left')
+        if not self.exact:
+            bins = np.clip(bins - 1, 0, n_bins - 2)
+        self.bins = np.bincount(groups * n_bins + bins, minlength=n_partitions * n_bins).reshape(n_partitions, n_bins)
+
+    def merge(self, selected):
+        """Merged statistics of the selected partitions as {stat: value}."""
+        count = self.count[selected]
+        n = int(count.sum())
+        if n == 0:
+            return {'count': 0}
+        used = count > 0
+        count, means, m2 = count[used], self.mean[selected][used], self.m2[selected][used]
+        mean = float((count * means).sum() / n)
+        m2 = float(m2.sum() + (count * (means - mean) ** 2).sum())
+        stats = {'count': n, 'mean': mean, 'std': np.sqrt(m2 / (n - 1)) if n > 1 else np.nan,
+                 'min': float(self.min[selected].min()), 'max': float(self.max[selected].max())}
+        cumulative = np.cumsum(self.bins[selected].sum(axis=0))
+        for q in QUANTILES:
+            stats[f'{q:.0%}'] = self._quantile(cumulative, q * (n - 1), stats['min'], stats['max'])
+        return stats
+
+    def _value_at(self, cumulative, rank):
+        # Value of the rank-th (0-based) sorted element.
+        b = int(np.searchsorted(cumulative, rank, side='right'))
+        if self.exact:
+            return float(self.edges[b])
+        # Assume the values of an equal-depth bin are spread evenly over it.
+        before = cumulative[b - 1] if b > 0 else 0
+        in_bin = cumulative[b] - before
+        fraction = (rank - before + 0.5) / in_bin if in_bin else 0.5
+        return float(self.edges[b] + (self.edges[b + 1] - self.edges[b]) * fraction)
+
+    def _quantile(self, cumulative, position, lo, hi):
+        below = int(np.floor(position))
+        weight = position - below
+        value = self._value_at(cumulative, below)
+        if weight:
+            value += weight * (self._value_at(cumulative, below + 1) - value)
+        return float(np.clip(value, lo, hi))
+
+class _TextPartials:
+    """Non-missing count and value counts per partition: all of them, or the TOP_K plus a HyperLogLog sketch."""
+
+    def __init__(self, series, partitions, n_partitions):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            codes, values = series.cat.codes.to_numpy(), series.cat.categories
+        else:
+            codes, values = pd.factorize(series, sort=False)
+        present = codes >= 0
+        codes, groups = codes[present].astype(np.int64), partitions[present]
+        self.values = values
+        self.count = np.bincount(groups, minlength=n_partitions)
+        n_values = max(len(values), 1)
+        keys, counts = np.unique(groups * n_values + codes, return_counts=True)
+        cell_groups, cell_codes = keys // n_values, keys % n_values
+        self.exact = len(values) <= MAX_EXACT_VALUES
+        if not self.exact:
+            # Keep the TOP_K most frequent values of each partition (cells are sorted by partition).
+            order = np.lexsort((-counts, cell_groups))
+            cell_groups, cell_codes, counts = cell_groups[order], cell_codes[order], counts[order]
+            starts = np.searchsorted(cell_groups, cell_groups, side='left')
+            keep = np.arange(len(cell_groups)) - starts < TOP_K
+            cell_groups, cell_codes, counts = cell_groups[keep], cell_codes[keep], counts[keep]
+            self.registers = _hll_registers(codes, groups, n_partitions)
+        self.cell_groups, self.cell_codes, self.cell_counts = cell_groups, cell_codes, counts
+
+    def merge(self, selected):
+        n = int(self.count[selected].sum())
+        if n == 0:
+            return {'count': 0, 'approx': not self.exact}
+        cells = selected[self.cell_groups]
+        totals = np.bincount(self.cell_codes[cells], weights=self.cell_counts[cells], minlength=len(self.values))
+        top = int(np.argmax(totals))
+        unique = int(np.count_nonzero(totals)) if self.exact else _hll_estimate(self.registers[selected].max(axis=0))
+        return {'count': n, 'unique': unique, 'top': str(self.values[top]), 'freq': int(totals[top]), 'approx': not self.exact}
+
+def _hll_registers(codes, groups, n_partitions):
+    """HyperLogLog registers (2**HLL_BITS per partition) of the hashed value codes."""
+    m = 1 << HLL_BITS
+    hashes = pd.util.hash_array(codes.astype(np.int64))
+    register = (hashes >> np.uint64(64 - HLL_BITS)).astype(np.int64)
+    rest = (hashes & np.uint64((1 << (64 - HLL_BITS)) - 1)).astype(np.float64)
+    # Leading zeros of the remaining bits, plus one: np.frexp gives the bit length.
+    rank = (64 - HLL_BITS) - np.frexp(rest)[1] + 1
+    registers = np.zeros(n_partitions * m, dtype=np.uint8)
+    np.maximum.at(registers, groups * m + register, rank.astype(np.uint8))
+    return registers.reshape(n_partitions, m)
+
+def _hll_estimate(registers):
+    m = len(registers)
+    estimate = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(2.0 ** -registers.astype(np.float64))
+    zeros = np.count_nonzero(registers == 0)
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return int(round(estimate))
+
+class ColumnStats:
+    """
+    describe(include='all')-style statistics of every column, kept as mergeable partials per partition
+    (every LaunchYear x CoarseType combination present). A summary of rows selected by year range and
+    type merges the partials of the matching partitions instead of rescanning rows: counts, means and
+    variances exactly, quantiles from bin counts over shared equal-depth bins (exact for columns with
+    few distinct values), unique/top/freq from value counts (approximate for very high-cardinality columns).
+    """
+
+    def __init__(self, df, partition_dims=PARTITION_DIMENSIONS):
+        self.dims = [dim for dim in partition_dims if dim in df.columns]
+        codes, self.labels = [], {}
+        for dim in self.dims:
+            cat = pd.Categorical(df[dim])
+            self.labels[dim] = np.concatenate([[None], np.asarray(cat.categories, dtype=object)])
+            codes.append(cat.codes.astype(np.int64) + 1)
+        sizes = [len(self.labels[dim]) for dim in self.dims]
+        keys = np.ravel_multi_index(codes, sizes) if self.dims else np.zeros(len(df), dtype=np.int64)
+        partition_keys, partitions = np.unique(keys, return_inverse=True)
+        partitions = partitions.ravel()
+        self.partition_codes = dict(zip(self.dims, np.unravel_index(partition_keys, sizes))) if self.dims else {}
+        n_partitions = len(partition_keys)
+        self.rows = np.bincount(partitions, minlength=n_partitions)
+        self.columns = {}
+        for column in df.columns:
+            series = df[column]
+            if pd.api.types.is_datetime64_any_dtype(series.dtype):
+                values = series.to_numpy(dtype='datetime64[ns]').astype(np.int64).astype(np.float64)
+                values[series.isna().to_numpy()] = np.nan
+                self.columns[column] = ('date', _NumericPartials(values, partitions, n_partitions))
+            elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                values = series.to_numpy(dtype='float64', na_value=np.nan)
+                self.columns[column] = ('numeric', _NumericPartials(values, partitions, n_partitions))
+            else:
+                self.columns[column] = ('text', _TextPartials(series, partitions, n_partitions))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _selected(self, years=None, filters=None):
+        selected = np.ones(len(self.rows), dtype=bool)
+        if years is not None and 'LaunchYear' in self.dims:
+            labels = pd.to_numeric(pd.Series(self.labels['LaunchYear']), errors='coerce').to_numpy(dtype='float64')
+            year = labels[self.partition_codes['LaunchYear']]
+            selected &= (year >= years[0]) & (year <= years[1])
+        for dim, values in (filters or {}).items():
+            wanted = pd.Series(self.labels[dim]).isin(list(values)).to_numpy()
+            selected &= wanted[self.partition_codes[dim]]
+        return selected
+
+    def summary(self, years=None, filters=None):
+        """
+        Statistics of the rows with LaunchYear in years (inclusive) and each {dim: values} filter, as
+        {'numeric': frame, 'dates': frame, 'text': frame}, one row per column of that kind.
+        """
+        selected = self._selected(years, filters)
+        rows = {'numeric': {}, 'date': {}, 'text': {}}
+        for column, (kind, partials) in self.columns.items():
+            rows[kind][column] = partials.merge(selected)
+        numeric = pd.DataFrame.from_dict(rows['numeric'], orient='index', columns=NUMERIC_STATS)
+        dates = pd.DataFrame.from_dict(rows['date'], orient='index', columns=DATE_STATS)
+        for stat in DATE_STATS[1:]:
+            dates[stat] = pd.to_datetime(dates[stat].astype('float64'), unit='ns')
+        text = pd.DataFrame.from_dict(rows['text'], orient='index', columns=TEXT_STATS)
+        return {'numeric': numeric.astype({'count': 'int64'}), 'dates': dates.astype({'count': 'int64'}),
+                'text': text.astype({'count': 'int64', 'unique': 'Int64', 'freq': 'Int64', 'approx': 'bool'})}
+
+def summarize(df):
+    """ColumnStats.summary of a whole frame (one partition), for row selections partitions cannot answer."""
+    return ColumnStats(df, partition_dims=()).summary()
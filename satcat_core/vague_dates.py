@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# GCAT vague dates: 'YYYY', 'YYYY Mon', 'YYYY Mon DD[.ddd]', 'YYYY Mon DD HHMM', 'YYYY Mon DD HHMM:SS[.s]',
+# optionally followed by '?' (uncertain) or 's' (scheduled, not yet confirmed).
+_VAGUE_DATE_RE = (
+    r'^\s*(?P<year>\d{4})'
+    r'(?:\s+(?P<month>[A-Za-z]{3})'
+    r'(?:\s+(?P<day>\d{1,2})(?P<dayfrac>\.\d+)?'
+    r'(?:\s+(?P<hour>\d{2})(?P<minute>\d{2})(?::(?P<second>\d{2}(?:\.\d*)?))?)?)?)?'
+    r'\s*(?P<flag>[?s]?)'
+)
+_MONTHS = {m: i + 1 for i, m in enumerate(['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'])}
+
+# Precision codes stored in the <col>_Prec columns: the level in the low bits, the markers as flags.
+PREC_NONE, PREC_YEAR, PREC_MONTH, PREC_DAY, PREC_MINUTE, PREC_SECOND = range(6)
+PREC_LEVEL_MASK = 0x0F
+PREC_UNCERTAIN = 0x10
+PREC_SCHEDULED = 0x20
+PRECISION_NAMES = {PREC_NONE: 'none', PREC_YEAR: 'year', PREC_MONTH: 'month', PREC_DAY: 'day',
+                   PREC_MINUTE: 'minute', PREC_SECOND: 'second'}
+VAGUE_DATE_COLUMNS = ['LDate', 'DDate', 'SDate', 'ODate']
+
+_NUMBER_PARTS = ['year', 'day', 'dayfrac', 'hour', 'minute', 'second']
+
+def _extract_parts(dates):
+    """
+    Regex groups of every date: float arrays (NaN where absent) for the numeric groups, and string
+    Series for 'month' and 'flag'. Uses Arrow's regex kernel when pyarrow is available.
+    """
+    if pa is not None:
+        try:
+            struct = pc.extract_regex(pa.array(dates, type=pa.string(), from_pandas=True), _VAGUE_DATE_RE)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass
+        else:
+            parts = {}
+            for name in _NUMBER_PARTS:
+                field = pc.struct_field(struct, name)
+                field = pc.if_else(pc.equal(field, ''), pa.scalar(None, pa.string()), field)
+                parts[name] = pc.cast(field, pa.float64()).to_numpy(zero_copy_only=False)
+            for name in ['month', 'flag']:
+                parts[name] = pc.struct_field(struct, name).to_pandas()
+            return parts
+    extracted = dates.str.extract(_VAGUE_DATE_RE)
+    parts = {name: pd.to_numeric(extracted[name], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+             for name in _NUMBER_PARTS}
+    parts['month'] = extracted['month']
+    parts['flag'] = extracted['flag']
+    return parts
+
+def parse_vague_dates(dates):
+    """
+    Parses a Series of GCAT vague dates into (datetime64[ns] Series, int8 precision-code Series).
+    The datetime is the start of the stated interval (e.g. '1990 Jun' -> 1990-06-01); unparseable dates are NaT
+    with precision PREC_NONE. The precision code is a PREC_* level OR'ed with PREC_UNCERTAIN / PREC_SCHEDULED.
+    """
+    parts = _extract_parts(dates)
+    year, day, hour, minute, second = (parts[name] for name in ['year', 'day', 'hour', 'minute', 'second'])
+    month = parts['month'].str.lower().map(_MONTHS).to_numpy(dtype='float64', na_value=np.nan)
+    dayfrac = np.nan_to_num(parts['dayfrac'])
+    # A month name that is not a month invalidates the rest of the date, like a malformed day would.
+    valid = ~np.isnan(year) & (year >= 1678) & (year <= 2261) & ~(~np.isnan(day) & np.isnan(month))
+    has_month = valid & ~np.isnan(month)
+    has_day = has_month & ~np.isnan(day)
+    has_minute = has_day & ~np.isnan(minute)
+    has_second = has_minute & ~np.isnan(second)
+    components = pd.DataFrame({
+        'year': np.where(valid, year, 2000),
+        'month': np.where(has_month, month, 1),
+        'day': np.where(has_day, day, 1),
+    })
+    stamps = pd.to_datetime(components, errors='coerce')
+    offset = (np.where(has_day, dayfrac, 0) * 86400 + np.where(has_minute, hour * 3600 + minute * 60, 0)
+              + np.where(has_second, second, 0))
+    stamps = stamps + pd.to_timedelta(np.round(offset * 1e6), unit='us')
+    stamps = stamps.astype('datetime64[ns]').where(valid)
+    stamps.index = dates.index
+
+    level = np.select([has_second, has_minute, has_day, has_month, valid],
+                      [PREC_SECOND, PREC_MINUTE, PREC_DAY, PREC_MONTH, PREC_YEAR], default=PREC_NONE)
+    level[stamps.isna().to_numpy()] = PREC_NONE
+    flag = parts['flag'].to_numpy(dtype=object, na_value='')
+    precision = (level | np.where(flag == '?', PREC_UNCERTAIN, 0) | np.where(flag == 's', PREC_SCHEDULED, 0)).astype(np.int8)
+    return stamps, pd.Series(precision, index=dates.index)
+
+def precision_level(precision):
+    """Strips the ?/s marker bits from precision codes."""
+    return precision & PREC_LEVEL_MASK
@@ -0,0 +1,26 @@
+import streamlit as st
+
+from paged_table import SEARCH_ROWS_KEY
+
+PREVIEW_COLUMNS = ['#JCAT', 'Satcat', 'Piece', 'Name', 'Owner', 'Type']
+PREVIEW_ROWS = 20
+
+def render_search(dataset):
+    """
+    Sidebar search over names, identifiers and owners. The matches are previewed in the sidebar and, unless
+    switched off, stored under SEARCH_ROWS_KEY so every data table shows only them.
+    """
+    st.sidebar.subheader("Search")
+    query = st.sidebar.text_input("Search the catalog", key='search_query', label_visibility='collapsed',
+                                  placeholder="Name, JCAT, catalog no., COSPAR ID, owner")
+    if not query.strip():
+        st.session_state[SEARCH_ROWS_KEY] = None
+        return
+    rows = dataset.search_index.search(query)
+    limit_tables = st.sidebar.checkbox("Show only matches in data tables", value=True, key='search_limit_tables')
+    st.session_state[SEARCH_ROWS_KEY] = rows if limit_tables else None
+    st.sidebar.caption(f"{len(rows):,} matching objects" + (f", first {PREVIEW_ROWS} shown" if len(rows) > PREVIEW_ROWS else ""))
+    if len(rows):
+        df = dataset.df
+        columns = [column for column in PREVIEW_COLUMNS if column in df.columns]
+        st.sidebar.dataframe(df.iloc[rows[:PREVIEW_ROWS]][columns], hide_index=True, use_container_width=True)
@@ -1,29 +1,64 @@
-import streamlit as st
+import numpy as np
 import plotly.express as px
+import streamlit as st
+from charts import category_figure, plotly_chart
+from satcat_core.binning import category_counts
+from paged_table import render_paged_table
 
-def render_tab(df):
+def render_tab(dataset):
+    df = dataset.view()
     st.header("Advanced Filters & Byte-level Exploration")
     st.info("""
     Use these filters to select objects by any SatType byte. Each byte gives extra detail about the object's role, status, or special flags. See the Help/Glossary tab for full explanations.
     """)
     filter_cols = [f'SatType_{i+1}' for i in range(12) if f'SatType_{i+1}' in df.columns]
-    adv_filtered_df = df.copy()
+    index = dataset.sattype_index
+    selected_bits = index.all_rows() if index is not None else None
     col1, col2 = st.columns(2)
-    with col1:
-        for col in filter_cols[:6]:
-            unique_vals = adv_filtered_df[col].dropna().unique().tolist()
-            selected = st.multiselect(f"Filter {col}", unique_vals, default=unique_vals)
-            adv_filtered_df = adv_filtered_df[adv_filtered_df[col].isin(selected)]
-    with col2:
-        for col in filter_cols[6:]:
-            unique_vals = adv_filtered_df[col].dropna().unique().tolist()
-            selected = st.multiselect(f"Filter {col}", unique_vals, default=unique_vals)
-            adv_filtered_df = adv_filtered_df[adv_filtered_df[col].isin(selected)]
+    for container, cols in ((col1, filter_cols[:6]), (col2, filter_cols[6:])):
+        with container:
+            for col in cols:
+                byte = int(col.rsplit('_', 1)[1]) - 1
+                unique_vals = index.available_values(byte, selected_bits)
+                selected = st.multiselect(f"Filter {col}", unique_vals, default=unique_vals)
+                selected_bits = selected_bits & index.any_of(byte, selected)
+    selected_rows = index.to_mask(selected_bits) if filter_cols else None
+    selected_rows = altitude_band_filter(dataset, selected_rows)
     st.markdown("**Filtered Data Table (Advanced)**")
-    st.dataframe(adv_filtered_df, use_container_width=True)
+    render_paged_table(dataset, key='advanced_table', rows=selected_rows)
     st.markdown("**Byte 1/2/3 Distribution in Filtered Data**")
     for b in [1,2,3]:
         colname = f'SatType_{b}'
-        if colname in adv_filtered_df.columns:
-            fig = px.histogram(adv_filtered_df, x=colname, title=f'Byte {b} Distribution', color=colname)
-            st.plotly_chart(fig, use_container_width=True)
+        if colname in df.columns:
+            fig = category_figure(category_counts(df[colname], selected_rows), f'Byte {b} Distribution')
+            plotly_chart(fig)
+
+def altitude_band_filter(dataset, selected_rows):
+    """Optional perigee-apogee overlap and inclination filter, answered by the dataset's AltitudeIndex."""
+    altitude = dataset.altitude_index
+    if altitude is None or not st.checkbox("Filter by altitude band (objects whose perigee-apogee range crosses it)",
+                                           key='altitude_band_on'):
+        return selected_rows
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        low, high = st.slider("Altitude band (km)", 0, 40000, (500, 600), step=10, key='altitude_band')
+    with col2:
+        use_inclination = st.checkbox("Match inclination", key='altitude_band_inc_on')
+        inclination = st.number_input("Inclination (deg)", 0.0, 180.0, 53.0, step=0.5, key='altitude_band_inc',
+                                      disabled=not use_inclination)
+    with col3:
+        tolerance = st.number_input("± degrees", 0.0, 90.0, 1.0, step=0.5, key='altitude_band_tol',
+                                    disabled=not use_inclination)
+    rows = altitude.overlapping(low, high, inclination if use_inclination else None, tolerance)
+    band_mask = np.zeros(len(dataset), dtype=bool)
+    band_mask[rows] = True
+    st.caption(f"{len(rows):,} objects cross {low:,}-{high:,} km"
+               + (f" at {inclination:g}° ± {tolerance:g}°" if use_inclination else ""))
+    # Crowding around the band: objects crossing each 50 km shell.
+    edges = np.arange(max(0, low - 1000), high + 1050, 50)
+    counts = altitude.band_counts(edges)
+    fig = px.bar(x=edges[:-1] + 25, y=counts, labels={'x': 'Altitude (km)', 'y': 'Objects crossing shell'},
+                 title='Objects crossing each 50 km altitude shell')
+    fig.add_vrect(x0=low, x1=high, fillcolor='orange', opacity=0.2, line_width=0)
+    plotly_chart(fig)
+    return band_mask if selected_rows is None else selected_rows & band_mask
@@ -1,8 +1,14 @@
 import streamlit as st
 import plotly.express as px
 import pandas as pd
+from charts import density_figure, plotly_chart
+from constants import SCATTER_MAX_POINTS
+from export_button import render_export
+from satcat_core.binning import AGGREGATIONS, MAX_GROUPS, aggregate_xy, downsample_rows, top_groups
+from satcat_core.filters import isin, make_spec
 
-def render_tab(df):
+def render_tab(dataset):
+    df = dataset.view()
     st.header("Custom Analysis & Visualization")
     st.info("""
     Build your own analysis! Select the data columns, chart type, and filters to create custom visualizations. This tool is designed for both non-technical and technical users.
@@ -12,24 +18,53 @@ def render_tab(df):
     y_col = st.selectbox("Y-axis column (for bar/line/scatter)", [col for col in all_columns if col != x_col], index=0)
     color_col = st.selectbox("Color/Group by (optional)", [None] + all_columns, index=0)
     chart_type = st.selectbox("Chart type", ["Bar", "Line", "Scatter", "Pie", "Histogram"])
+    y_numeric = pd.api.types.is_numeric_dtype(df[y_col])
+    if chart_type in ("Bar", "Line", "Pie"):
+        # Marks are aggregated per x (and color group) on the server instead of drawing one per row.
+        aggregations = AGGREGATIONS if y_numeric else ['count']
+        default_how = {'Bar': 'sum', 'Line': 'mean', 'Pie': 'sum'}[chart_type]
+        how = st.selectbox("Aggregate Y per X", aggregations, index=aggregations.index(default_how) if default_how in aggregations else 0)
     st.markdown("**Add Filters** (optional)")
     filter_col = st.selectbox("Filter column", [None] + all_columns, index=0)
+    used_columns = list(dict.fromkeys(col for col in (x_col, y_col, color_col) if col))
     if filter_col:
         unique_vals = df[filter_col].dropna().unique().tolist()
         selected_vals = st.multiselect(f"Select values for {filter_col}", unique_vals, default=unique_vals)
-        custom_df = df[df[filter_col].isin(selected_vals)]
+        spec = make_spec({filter_col: isin(selected_vals)})
+        custom_df = dataset.filters.select(spec, columns=used_columns)
+        custom_rows = dataset.filters.rows(spec)
     else:
-        custom_df = df.copy()
+        custom_df = df[used_columns]
+        custom_rows = None
     st.markdown("---")
     st.subheader("Custom Chart")
-    if chart_type == "Bar":
-        fig = px.bar(custom_df, x=x_col, y=y_col, color=color_col if color_col else None)
-    elif chart_type == "Line":
-        fig = px.line(custom_df, x=x_col, y=y_col, color=color_col if color_col else None)
+    color = color_col if color_col else None
+    if chart_type in ("Bar", "Line"):
+        y_name = 'Count' if how == 'count' else y_col
+        agg_df, truncated = top_groups(aggregate_xy(custom_df, x_col, y_col, color, how), x_col, y_name)
+        if truncated:
+            st.caption(f"Showing the {MAX_GROUPS} {x_col} values with the largest {y_name}.")
+        title = f"{how} of {y_col} by {x_col}" if how != 'count' else f"Rows by {x_col}"
+        plot = px.bar if chart_type == "Bar" else px.line
+        fig = plot(agg_df, x=x_col, y=y_name, color=color if color in agg_df.columns else None, title=title)
     elif chart_type == "Scatter":
-        fig = px.scatter(custom_df, x=x_col, y=y_col, color=color_col if color_col else None)
+        n_points = len(custom_df)
+        numeric_xy = pd.api.types.is_numeric_dtype(custom_df[x_col]) and y_numeric
+        if n_points > SCATTER_MAX_POINTS:
+            modes = ["Density (2-D bins)", "Random sample"] if numeric_xy else ["Random sample"]
+            mode = st.radio(f"{n_points:,} points exceed the {SCATTER_MAX_POINTS:,}-point limit; show them as", modes, horizontal=True)
+            if mode.startswith("Density"):
+                fig = density_figure(custom_df[x_col], custom_df[y_col], x_col, y_col)
+            else:
+                sample = custom_df.iloc[downsample_rows(n_points, SCATTER_MAX_POINTS)]
+                fig = px.scatter(sample, x=x_col, y=y_col, color=color, render_mode='webgl',
+                                 title=f"Random sample of {SCATTER_MAX_POINTS:,} of {n_points:,} points")
+        else:
+            fig = px.scatter(custom_df, x=x_col, y=y_col, color=color, render_mode='webgl')
     elif chart_type == "Pie":
-        fig = px.pie(custom_df, names=x_col, values=y_col if y_col else None, color=color_col if color_col else None)
+        y_name = 'Count' if how == 'count' else y_col
+        agg_df, truncated = top_groups(aggregate_xy(custom_df, x_col, y_col, None, how), x_col, y_name)
+        fig = px.pie(agg_df, names=x_col, values=y_name)
     elif chart_type == "Histogram":
         if pd.api.types.is_numeric_dtype(custom_df[x_col]):
             bin_edges = [0, 5, 10, 20, 30, 50, 100, 200, 300, 500, 1000, 2000, 3000, 5000, 10000, 20000, 50000, 100000, 200000, 500000, 1000000]
@@ -47,10 +82,13 @@ def render_tab(df):
             else:
                 fig = None
         else:
-            fig = px.histogram(custom_df, x=x_col, color=color_col if color_col else None)
+            agg_df, truncated = top_groups(aggregate_xy(custom_df, x_col, None, color), x_col, 'Count')
+            fig = px.bar(agg_df, x=x_col, y='Count', color=color if color in agg_df.columns else None)
     else:
         fig = None
     if fig:
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     else:
         st.info("Select chart options to display a chart.")
+    st.markdown("**Export the charted rows** (the X, Y and color columns of every row passing the filter)")
+    render_export(dataset, 'custom', rows=custom_rows, columns=used_columns)
@@ -2,12 +2,17 @@ import streamlit as st
 import os
 from datetime import datetime
 from constants import SATCAT_URL
-from data_loader import fetch_and_update_satcat, parse_satcat_html, get_satcat_update_date
+from satcat_core.parsing import get_satcat_update_date
+from refresh_scheduler import get_scheduler
 
-def render_tab(df, file_update_date=None):
+def _format_time(timestamp):
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M:%S') if timestamp else 'never'
+
+def render_tab(dataset):
     st.header("Data Source & Update")
     st.markdown("""
     You can load the latest SATCAT file from the web (planet4589.org) or use the local file (`satcat.html`).
+    Downloads run in the background; every open session switches to the new data on its next interaction.
     """)
     data_file = 'satcat.html'
     file_update_date = get_satcat_update_date(data_file)
@@ -16,19 +21,25 @@ def render_tab(df, file_update_date=None):
     else:
         today_str = datetime.now().strftime('%Y %b %-d')
     st.info(f"Current SATCAT file update date: **{file_update_date if file_update_date else 'Unknown'}**")
-    load_web = False
+    st.caption(f"Loaded dataset: update date {dataset.update_date or 'Unknown'}, generation {dataset.generation}, {len(dataset):,} objects.")
+    scheduler = get_scheduler(data_file)
     if st.button("Load Latest SATCAT from Web"):
         if file_update_date and file_update_date == today_str:
-            st.warning("The SATCAT file is already up-to-date for today. Downloading again is usually not necessary.")
-            if st.confirm("Are you sure you want to download the file again?"):
-                load_web = True
-        else:
-            load_web = True
-    if load_web:
-        df_new = fetch_and_update_satcat(data_file, SATCAT_URL)
-        if df_new is not None:
-            st.success("SATCAT data updated and loaded.")
-        else:
-            st.error("Failed to update SATCAT data from the web.")
-    st.caption("If the file is already up-to-date, you will see a warning.")
-    # TODO: Wire up fetch logic if needed
+            st.warning("The SATCAT file is already up-to-date for today; the server will most likely report it unchanged.")
+        scheduler.trigger()
+        st.success(f"Checking {SATCAT_URL} in the background.")
+    status = scheduler.status()
+    st.subheader("Background Refresh")
+    if scheduler.interval:
+        st.markdown(f"Checks every **{scheduler.interval / 3600:g} h**; next check: **{_format_time(status['next_check'])}**.")
+    else:
+        st.markdown("Scheduled checks are off (set `SATEXPLORER_REFRESH_HOURS` to enable); checks run when requested above.")
+    st.markdown(f"""
+    - State: **{status['state']}**
+    - Last check: {_format_time(status['last_check'])} ({status['last_result'] or 'no result yet'})
+    - Last update loaded: {_format_time(status['last_update'])}
+    """)
+    if status['last_error']:
+        st.error(f"Last check failed ({status['failures']} in a row): {status['last_error']}")
+    if st.button("Refresh status"):
+        st.rerun()
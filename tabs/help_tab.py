@@ -1,8 +1,8 @@
 import streamlit as st
 import re
-from utils import get_date_confidence
+from satcat_core.classify import get_date_confidence
 
-def render_tab(df):
+def render_tab(dataset):
     st.header("Help & Glossary")
     st.markdown("""
     This tool enables advanced analysis of global satellite and space object data, using the SATCAT dataset from [planet4589.org](https://planet4589.org/space/gcat/data/cats/satcat). We are deeply thankful to planet4589.org and Jonathan McDowell for making this invaluable data available—their catalog is our only source of data for this dashboard.
@@ -20,6 +20,8 @@ def render_tab(df):
     - **CoarseType**: The first character of Type (Byte 1), main object category.
     - **LDate**: Launch date (may be approximate).
     - **LaunchYear**: Year extracted from LDate.
+    - **LDate_DT / DDate_DT / SDate_DT / ODate_DT**: The launch, decay, separation and orbit epoch dates parsed to timestamps (start of the stated period).
+    - **LDate_Prec** (and the other *_Prec columns): Precision of the parsed date: 1=year, 2=month, 3=day, 4=minute, 5=second; +16 if marked uncertain (`?`), +32 if scheduled (`s`).
     - **Mass**: Mass in kilograms.
     - **Perigee**: Closest point to Earth in orbit (km).
     - **Apogee**: Farthest point from Earth in orbit (km).
@@ -0,0 +1,89 @@
+import streamlit as st
+import plotly.express as px
+from charts import plotly_chart
+from paged_table import render_paged_table
+
+CHAIN_COLUMNS = ['#JCAT', 'Piece', 'Type', 'Name', 'LDate', 'Status']
+
+def render_tab(dataset):
+    st.header("Object Hierarchy")
+    st.info("""
+    Every catalog entry can name a **parent** object (the `Parent` column): debris points back at the satellite or stage it broke off, components at the object that released them. This tab follows those links in both directions, using an index built once per catalog.
+    """)
+    hierarchy = dataset.hierarchy
+    if hierarchy is None:
+        st.warning("No #JCAT/Parent data available.")
+        return
+    df = dataset.view()
+    clouds = dataset.debris_clouds
+    st.subheader("Largest Debris Clouds")
+    st.info("""
+    **What does this show?**
+    Each row is a top-level object with everything descended from it: its fragments, their fragments, and so on. `MaxDepth` is the longest parent chain, and the type columns count descendants by CoarseType (D = debris, R = rocket stage, C = component).
+    """)
+    if clouds.empty:
+        st.info("No objects with descendants.")
+    else:
+        top_n = len(clouds)
+        if top_n > 5:
+            top_n = st.slider("Clouds shown", 5, min(100, top_n), min(20, top_n), key='hierarchy_top_n')
+        top = clouds.head(top_n)
+        type_columns = [column for column in top.columns if column.startswith('CoarseType_')]
+        if type_columns:
+            bars = top.melt(id_vars=['JCAT'], value_vars=type_columns, var_name='CoarseType', value_name='Objects')
+            bars['CoarseType'] = bars['CoarseType'].str.removeprefix('CoarseType_')
+            fig = px.bar(bars, x='JCAT', y='Objects', color='CoarseType', barmode='stack',
+                         title=f'Descendants of the {len(top)} Largest Clouds by Type')
+            plotly_chart(fig)
+        st.dataframe(top, use_container_width=True, hide_index=True)
+    st.subheader("Explore an Object")
+    default = clouds['JCAT'].iloc[0] if not clouds.empty else ''
+    jcat = st.text_input("JCAT", value=default, key='hierarchy_jcat', help="Catalog id such as S00001.").strip().upper()
+    row = hierarchy.row_of(jcat) if jcat else None
+    if row is None:
+        if jcat:
+            st.warning(f"No object with JCAT {jcat}.")
+    else:
+        columns = [column for column in CHAIN_COLUMNS if column in df.columns]
+        ancestors = hierarchy.ancestors(row)
+        children = hierarchy.children(row)
+        subtree = hierarchy.subtree(row)
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Parent chain", len(ancestors))
+        col2.metric("Direct children", len(children))
+        col3.metric("All descendants", len(subtree))
+        st.markdown("**Object and its parent chain** (up to the top-level object)")
+        chain = df.iloc[[row, *ancestors]][columns]
+        chain.insert(0, 'Level', range(0, -len(chain), -1))
+        st.dataframe(chain, use_container_width=True, hide_index=True)
+        if len(subtree):
+            st.markdown("**Descendants**")
+            if 'CoarseType' in df.columns:
+                counts = df['CoarseType'].iloc[subtree].value_counts().rename_axis('CoarseType').reset_index(name='Objects')
+                fig = px.bar(counts, x='CoarseType', y='Objects', title=f'Descendants of {jcat} by Type')
+                plotly_chart(fig)
+            render_paged_table(dataset, key='hierarchy_table', rows=subtree)
+    st.subheader("Objects per Launch")
+    st.info("""
+    **What does this show?**
+    Objects grouped by launch: the international designator without the piece letters (1998-067A and 1998-067BZ are both launch 1998-067), split by CoarseType.
+    """)
+    launch_counts = hierarchy.launch_counts(df)
+    if launch_counts.empty:
+        st.info("No Piece (international designator) data available.")
+        return
+    default_launch = ''
+    if row is not None and hierarchy.launch_codes[row] >= 0:
+        default_launch = hierarchy.launches[hierarchy.launch_codes[row]]
+    launch = st.text_input("Launch (e.g. 1998-067)", value=default_launch, key='hierarchy_launch').strip()
+    if launch:
+        selected = launch_counts[launch_counts['Launch'] == launch]
+        if selected.empty:
+            st.warning(f"No objects from launch {launch}.")
+        else:
+            st.dataframe(selected, use_container_width=True, hide_index=True)
+            with st.expander(f"Objects from {launch}"):
+                st.dataframe(df.iloc[hierarchy.launch_rows(launch)][[c for c in CHAIN_COLUMNS if c in df.columns]],
+                             use_container_width=True, hide_index=True)
+    st.markdown("**Launches with the most catalogued objects**")
+    st.dataframe(launch_counts.head(20), use_container_width=True, hide_index=True)
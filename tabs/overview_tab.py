@@ -1,9 +1,15 @@
 import streamlit as st
-import numpy as np
+import pandas as pd
+from datetime import date
 import plotly.express as px
-from utils import get_date_confidence
+from charts import histogram_figure, plotly_chart
+from satcat_core.binning import numeric_histogram
+from satcat_core.filters import between, isin, make_spec
+from satcat_core.stats import summarize
+from paged_table import render_paged_table
 
-def render_tab(df):
+def render_tab(dataset):
+    df = dataset.view()
     st.header("Overview")
     st.markdown("""
     Welcome to the Satellite Catalog Explorer! This dashboard lets you explore and analyze the global satellite catalog. Use the filters and charts to answer questions about satellite types, launches, and more. Hover over info icons for explanations.
@@ -21,12 +27,26 @@ def render_tab(df):
         year_range = st.slider("Launch Year Range", min_year, max_year, (min_year, max_year))
     else:
         year_range = (None, None)
-    filtered_df = df.copy()
-    if selected_types:
-        filtered_df = filtered_df[filtered_df['CoarseType'].isin(selected_types)]
+    conditions = {'CoarseType': isin(selected_types) if selected_types else None}
+    refined = False
     if year_range[0] is not None:
-        filtered_df = filtered_df[(filtered_df['LaunchYear'] >= year_range[0]) & (filtered_df['LaunchYear'] <= year_range[1])]
-    st.dataframe(filtered_df.assign(DateConfidence=filtered_df['LDate'].apply(get_date_confidence)) if 'LDate' in filtered_df.columns else filtered_df, use_container_width=True)
+        conditions['LaunchYear'] = between(year_range[0], year_range[1])
+        if 'LDate_DT' in df.columns and st.checkbox("Refine by launch date", help="Dates known only to the month or year count from the first day of that period."):
+            date_range = st.date_input("Launch Date Range", (date(year_range[0], 1, 1), date(year_range[1], 12, 31)),
+                                       min_value=date(min_year, 1, 1), max_value=date(max_year, 12, 31))
+            if len(date_range) == 2:
+                day_end = pd.Timestamp(date_range[1]) + pd.Timedelta(days=1) - pd.Timedelta(1, unit='ns')
+                conditions['LDate_DT'] = between(pd.Timestamp(date_range[0]), day_end)
+                refined = True
+    spec = make_spec(conditions)
+    filtered_df = dataset.filters.select(spec)
+    # Without a day-level refinement the charts are answered from the aggregate cube instead of the rows.
+    def counts(by):
+        if refined:
+            return filtered_df.groupby(by, observed=True).size().reset_index(name='Count')
+        return dataset.trend_cube.query(by, years=year_range if year_range[0] is not None else None,
+                                        filters={'CoarseType': selected_types} if selected_types else None)
+    render_paged_table(dataset, key='overview_table', rows=dataset.filters.mask(spec))
     st.subheader("Charts")
     col1, col2 = st.columns(2)
     with col1:
@@ -35,9 +55,10 @@ def render_tab(df):
         **What does this chart show?**
         This pie chart shows the proportion of each main object type (payload, rocket stage, debris, etc.) in the catalog. 'Payload' means a satellite or experiment, 'Rocket' is a launch vehicle stage, and 'Debris' is a fragment or component.
         """)
-        if 'CoarseType' in filtered_df.columns and not filtered_df['CoarseType'].isna().all():
-            fig = px.pie(filtered_df, names='CoarseType', title='Satellite Type Distribution')
-            st.plotly_chart(fig, use_container_width=True)
+        type_counts = counts(['CoarseType']) if 'CoarseType' in filtered_df.columns else None
+        if type_counts is not None and not type_counts.empty:
+            fig = px.pie(type_counts, names='CoarseType', values='Count', title='Satellite Type Distribution')
+            plotly_chart(fig)
         else:
             st.info("No CoarseType data available.")
     with col2:
@@ -46,10 +67,10 @@ def render_tab(df):
         **What does this chart show?**
         This line chart shows how many objects were launched each year. It helps you see trends in space activity over time.
         """)
-        if 'LaunchYear' in filtered_df.columns and not filtered_df['LaunchYear'].isna().all():
-            launches = filtered_df['LaunchYear'].dropna().astype(int).value_counts().sort_index()
-            fig = px.line(x=launches.index, y=launches.values, labels={'x': 'Year', 'y': 'Launches'}, title='Launches per Year')
-            st.plotly_chart(fig, use_container_width=True)
+        launches = counts(['LaunchYear']) if 'LaunchYear' in filtered_df.columns else None
+        if launches is not None and not launches.empty:
+            fig = px.line(x=launches['LaunchYear'].astype(int), y=launches['Count'], labels={'x': 'Year', 'y': 'Launches'}, title='Launches per Year')
+            plotly_chart(fig)
         else:
             st.info("No LaunchYear data available.")
     st.subheader("Mass Distribution")
@@ -57,21 +78,11 @@ def render_tab(df):
     **What does this chart show?**
     This histogram shows the distribution of object masses (in kilograms). It helps you see if most objects are small, large, or somewhere in between.
     """)
-    if 'Mass' in filtered_df.columns and not filtered_df['Mass'].isna().all():
-        mass_data = filtered_df['Mass'].dropna()
-        if len(mass_data) > 1:
-            q75, q25 = np.percentile(mass_data, [75, 25])
-            iqr = q75 - q25
-            bin_width = 2 * iqr / (len(mass_data) ** (1/3)) if iqr > 0 else (mass_data.max() - mass_data.min()) / 20
-            if bin_width > 0:
-                bins = int(np.ceil((mass_data.max() - mass_data.min()) / bin_width))
-            else:
-                bins = 10
-        else:
-            bins = 10
-        fig = px.histogram(filtered_df, x='Mass', nbins=bins, title='Mass Distribution (kg)', labels={"Mass": "Mass (kg)"})
+    if 'Mass' in df.columns and not df['Mass'].isna().all():
+        edges, bin_counts = numeric_histogram(df['Mass'], dataset.filters.mask(spec))
+        fig = histogram_figure(edges, bin_counts, 'Mass Distribution (kg)', 'Mass (kg)')
         fig.update_xaxes(dtick=500)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig)
     else:
         st.info("No Mass data available.")
     st.subheader("Basic Statistics")
@@ -79,7 +90,15 @@ def render_tab(df):
     **What does this table show?**
     This table summarizes the main statistics (like average, min, max) for each column in the filtered data.
     """)
-    try:
-        st.write(filtered_df.describe(include='all').transpose())
-    except Exception as e:
-        st.warning(f"Could not compute statistics: {e}")
+    # Merged from per-year/type partial statistics; a day-level refinement summarizes the selected rows.
+    if refined:
+        summary = summarize(filtered_df)
+    else:
+        summary = dataset.stats.summary(years=year_range if year_range[0] is not None else None,
+                                         filters={'CoarseType': selected_types} if selected_types else None)
+    st.markdown("**Numeric columns** (quartiles are approximate for columns with many distinct values)")
+    st.dataframe(summary['numeric'], use_container_width=True)
+    st.markdown("**Date columns**")
+    st.dataframe(summary['dates'], use_container_width=True)
+    st.markdown("**Text columns** (`approx`: unique is estimated and top/freq come from each partition's most common values)")
+    st.dataframe(summary['text'], use_container_width=True)
@@ -1,9 +1,10 @@
 import streamlit as st
+from paged_table import render_paged_table
 
 
-def render_tab(df):
+def render_tab(dataset):
     st.header("Raw Data Table")
     st.info("""
     This table shows all columns and raw data for each object. Use it for detailed inspection or export.
     """)
-    st.dataframe(df, use_container_width=True)
+    render_paged_table(dataset, key='raw_table')
@@ -1,7 +1,8 @@
 import streamlit as st
-import plotly.express as px
+from charts import category_figure, plotly_chart
 
-def render_tab(df):
+def render_tab(dataset):
+    df = dataset.view()
     st.header("SatType Analysis (Bytes 1, 2, 3)")
     st.info("""
     Analyze the SatType code's first three bytes: Coarse Type, Type Modifier, and Attach Flag. Use the filters below to focus on specific types or years.
@@ -15,11 +16,12 @@ def render_tab(df):
         year_range = st.slider("Launch Year Range", min_year, max_year, (min_year, max_year), key='sattype_year')
     else:
         year_range = (None, None)
-    sattype_df = df.copy()
-    if selected_types:
-        sattype_df = sattype_df[sattype_df['CoarseType'].isin(selected_types)]
-    if year_range[0] is not None:
-        sattype_df = sattype_df[(sattype_df['LaunchYear'] >= year_range[0]) & (sattype_df['LaunchYear'] <= year_range[1])]
+    cube = dataset.sattype_cube
+    def counts(col):
+        """Objects per value of col under the year and type filters, most common first."""
+        return cube.query([col], years=year_range if year_range[0] is not None else None,
+                          filters={'CoarseType': selected_types} if selected_types else None) \
+            .sort_values('Count', ascending=False, kind='stable')
     # Byte 1
     st.subheader("Byte 1: Coarse Type Distribution")
     st.info("""
@@ -32,10 +34,11 @@ def render_tab(df):
     - **X**: Deleted entry
     - **Z**: Spurious entry
     """)
-    if 'SatType_1' in sattype_df.columns:
-        fig1 = px.histogram(sattype_df, x='SatType_1', title='Coarse Type (Byte 1) Distribution', color='SatType_1')
-        st.plotly_chart(fig1, use_container_width=True)
-        st.dataframe(sattype_df['SatType_1'].value_counts().rename_axis('Coarse Type').reset_index(name='Count'))
+    if 'SatType_1' in cube.dims:
+        sattype_1_counts = counts('SatType_1')
+        fig1 = category_figure(sattype_1_counts, 'Coarse Type (Byte 1) Distribution')
+        plotly_chart(fig1)
+        st.dataframe(sattype_1_counts.rename(columns={'SatType_1': 'Coarse Type'}), hide_index=True)
     else:
         st.info("No SatType_1 data available.")
     # Byte 2
@@ -50,15 +53,17 @@ def render_tab(df):
     - **C**: Cargo placeholder
     - **D**: Deployer for separately integrated payload
     """)
-    if 'SatType_2' in sattype_df.columns:
-        fig2 = px.histogram(sattype_df, x='SatType_2', title='Type Modifier (Byte 2) Distribution', color='SatType_2')
-        st.plotly_chart(fig2, use_container_width=True)
-        st.dataframe(sattype_df['SatType_2'].value_counts().rename_axis('Type Modifier').reset_index(name='Count'))
+    if 'SatType_2' in cube.dims:
+        sattype_2_counts = counts('SatType_2')
+        fig2 = category_figure(sattype_2_counts, 'Type Modifier (Byte 2) Distribution')
+        plotly_chart(fig2)
+        st.dataframe(sattype_2_counts.rename(columns={'SatType_2': 'Type Modifier'}), hide_index=True)
         st.markdown("**Combined Byte 1/2 Analysis**")
-        if 'SatType_1_2' in sattype_df.columns:
-            fig2b = px.histogram(sattype_df, x='SatType_1_2', title='Combined Byte 1/2 Distribution', color='SatType_1_2')
-            st.plotly_chart(fig2b, use_container_width=True)
-            st.dataframe(sattype_df['SatType_1_2'].value_counts().rename_axis('Byte 1-2').reset_index(name='Count'))
+        if 'SatType_1_2' in cube.dims:
+            sattype_1_2_counts = counts('SatType_1_2')
+            fig2b = category_figure(sattype_1_2_counts, 'Combined Byte 1/2 Distribution')
+            plotly_chart(fig2b)
+            st.dataframe(sattype_1_2_counts.rename(columns={'SatType_1_2': 'Byte 1-2'}), hide_index=True)
     else:
         st.info("No SatType_2 data available.")
     # Byte 3
@@ -71,9 +76,10 @@ def render_tab(df):
     - **T**: Never flew free but transferred
     - **I**: Internal (remains inside another object)
     """)
-    if 'SatType_3' in sattype_df.columns:
-        fig3 = px.histogram(sattype_df, x='SatType_3', title='Attach Flag (Byte 3) Distribution', color='SatType_3')
-        st.plotly_chart(fig3, use_container_width=True)
-        st.dataframe(sattype_df['SatType_3'].value_counts().rename_axis('Attach Flag').reset_index(name='Count'))
+    if 'SatType_3' in cube.dims:
+        sattype_3_counts = counts('SatType_3')
+        fig3 = category_figure(sattype_3_counts, 'Attach Flag (Byte 3) Distribution')
+        plotly_chart(fig3)
+        st.dataframe(sattype_3_counts.rename(columns={'SatType_3': 'Attach Flag'}), hide_index=True)
     else:
         st.info("No SatType_3 data available.")